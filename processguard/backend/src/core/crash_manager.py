@@ -1,7 +1,7 @@
 import asyncio
 from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
-from collections import deque, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 
@@ -14,7 +14,7 @@ class CrashAction(Enum):
     KILL_DEPENDENCIES = "kill_dependencies"
     QUARANTINE = "quarantine"
 
-@dataclass
+@dataclass(slots=True)
 class CrashEvent:
     timestamp: datetime
     process_name: str
@@ -22,6 +22,65 @@ class CrashEvent:
     exit_code: Optional[int] = None
     restart_attempt: int = 0
 
+class CrashHistory:
+    """Bounded ring of crash events whose slots are reused in place once full"""
+
+    __slots__ = ("_slots", "_start", "_size", "_capacity")
+
+    def __init__(self, capacity: int = 100):
+        self._slots: List[CrashEvent] = []
+        self._start = 0
+        self._size = 0
+        self._capacity = capacity
+
+    def append(self, timestamp: datetime, process_name: str, crash_reason: str,
+               exit_code: Optional[int] = None) -> CrashEvent:
+        """Record a crash, recycling the oldest slot when the ring is full"""
+        if self._size < self._capacity:
+            index = self._size
+            self._size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self._capacity
+
+        if index < len(self._slots):
+            event = self._slots[index]
+            event.timestamp = timestamp
+            event.process_name = process_name
+            event.crash_reason = crash_reason
+            event.exit_code = exit_code
+            event.restart_attempt = 0
+        else:
+            event = CrashEvent(timestamp, process_name, crash_reason, exit_code)
+            self._slots.append(event)
+
+        return event
+
+    def count_since(self, cutoff: datetime) -> int:
+        """Count events newer than cutoff; events are stored oldest first so this is a binary search"""
+        slots, start, capacity = self._slots, self._start, self._capacity
+        low, high = 0, self._size
+        while low < high:
+            mid = (low + high) // 2
+            if slots[(start + mid) % capacity].timestamp > cutoff:
+                high = mid
+            else:
+                low = mid + 1
+        return self._size - low
+
+    def clear(self):
+        """Forget all events while keeping the allocated slots for reuse"""
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        slots, start, capacity = self._slots, self._start, self._capacity
+        for offset in range(self._size):
+            yield slots[(start + offset) % capacity]
+
 @dataclass
 class CrashPolicy:
     max_crashes: int = 5
@@ -38,7 +97,7 @@ class CrashManager:
         self.logger = get_logger(__name__)
 
         # Track crash events per process
-        self.crash_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.crash_history: Dict[str, CrashHistory] = defaultdict(CrashHistory)
 
         # Process dependencies (who depends on whom)
         self.dependencies: Dict[str, Set[str]] = defaultdict(set)
@@ -71,15 +130,10 @@ class CrashManager:
     async def record_crash(self, process_name: str, crash_reason: str,
                           exit_code: Optional[int] = None) -> CrashAction:
         """Record a crash event and determine action"""
-        crash_event = CrashEvent(
-            timestamp=datetime.now(),
-            process_name=process_name,
-            crash_reason=crash_reason,
-            exit_code=exit_code
+        crash_event = self.crash_history[process_name].append(
+            datetime.now(), process_name, crash_reason, exit_code
         )
 
-        self.crash_history[process_name].append(crash_event)
-
         self.logger.warning(f"Crash recorded for {process_name}: {crash_reason} (exit code: {exit_code})")
 
         # Determine action based on crash policy
@@ -98,12 +152,7 @@ class CrashManager:
         time_window = timedelta(minutes=policy.time_window_minutes)
         cutoff_time = datetime.now() - time_window
 
-        recent_crashes = [
-            crash for crash in self.crash_history[process_name]
-            if crash.timestamp > cutoff_time
-        ]
-
-        crash_count = len(recent_crashes)
+        crash_count = self.crash_history[process_name].count_since(cutoff_time)
 
         self.logger.info(f"{process_name}: {crash_count} crashes in last {policy.time_window_minutes} minutes (threshold: {policy.max_crashes})")
 
@@ -180,23 +229,34 @@ class CrashManager:
         """Check if a process can be restarted (not disabled or quarantined)"""
 
         # Check if disabled
-        if process_name in self.disabled_processes:
-            disabled_at = self.disabled_processes[process_name]
+        disabled_at = self.disabled_processes.get(process_name)
+        if disabled_at is not None:
             return False, f"Process disabled due to crashes at {disabled_at}"
 
         # Check if quarantined
-        if process_name in self.quarantined_processes:
-            quarantine_until = self.quarantined_processes[process_name]
-            if datetime.now() < quarantine_until:
-                remaining = quarantine_until - datetime.now()
+        quarantine_until = self.quarantined_processes.get(process_name)
+        if quarantine_until is not None:
+            now = datetime.now()
+            if now < quarantine_until:
+                remaining = quarantine_until - now
                 return False, f"Process quarantined for {remaining.total_seconds():.0f} more seconds"
-            else:
-                # Quarantine period expired, remove from quarantine
-                del self.quarantined_processes[process_name]
-                self.logger.info(f"Process {process_name} released from quarantine")
+
+            # Quarantine period expired, remove from quarantine
+            del self.quarantined_processes[process_name]
+            self.logger.info(f"Process {process_name} released from quarantine")
 
         return True, "Process can be restarted"
 
+    def get_blocked_processes(self) -> Set[str]:
+        """Get names of processes that are disabled or still inside their quarantine window"""
+        now = datetime.now()
+        blocked = set(self.disabled_processes)
+        blocked.update(
+            process for process, until in self.quarantined_processes.items()
+            if now < until
+        )
+        return blocked
+
     def force_enable_process(self, process_name: str) -> bool:
         """Force enable a disabled process (admin override)"""
         removed = False
@@ -1,6 +1,8 @@
 import asyncio
+import logging
 import signal
 import sys
+from dataclasses import fields
 from typing import Dict, List
 from datetime import datetime
 import json
@@ -17,6 +19,11 @@ from .alerting import AlertManager, NotificationConfig
 from ..models.process import ProcessConfig, ProcessType
 from ..utils.logging import setup_logging, get_logger
 
+_METRICS_LOG_TEMPLATE = "CPU: {:.1f}%, Memory: {:.1f}MB, Threads: {}"
+
+_PROCESS_TYPES = {process_type.value: process_type for process_type in ProcessType}
+_PROCESS_CONFIG_FIELDS = frozenset(f.name for f in fields(ProcessConfig) if f.init) - {"process_type"}
+
 class ProcessGuardDaemon:
     def __init__(self, config_file: str = "/etc/processguard/config.json"):
         self.config_file = config_file
@@ -28,6 +35,7 @@ class ProcessGuardDaemon:
         )
 
         self.logger = get_logger(__name__)
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
         self.process_manager = ProcessManager()
         self.system_monitor = SystemMonitor()
@@ -56,10 +64,11 @@ class ProcessGuardDaemon:
         }
 
         try:
-            if Path(self.config_file).exists():
-                with open(self.config_file, 'r') as f:
-                    user_config = json.load(f)
-                    default_config.update(user_config)
+            config_path = Path(self.config_file)
+            if config_path.exists():
+                # Parse the raw bytes directly instead of going through a text wrapper
+                user_config = json.loads(config_path.read_bytes())
+                default_config.update(user_config)
         except Exception as e:
             print(f"Warning: Could not load config file {self.config_file}: {e}")
             print("Using default configuration")
@@ -75,39 +84,32 @@ class ProcessGuardDaemon:
         signal.signal(signal.SIGINT, signal_handler)
 
     def _load_processes_from_config(self):
-        for process_config in self.config.get("processes", []):
+        loaded = 0
+
+        # The raw roster is only needed once; drop it so the parsed dicts don't outlive their ProcessConfigs
+        for process_config in self.config.pop("processes", []):
             try:
-                process_type = ProcessType(process_config.get("type", "generic"))
-
-                config = ProcessConfig(
-                    name=process_config["name"],
-                    command=process_config["command"],
-                    working_dir=process_config["working_dir"],
-                    process_type=process_type,
-                    env_vars=process_config.get("env_vars", {}),
-                    auto_restart=process_config.get("auto_restart", True),
-                    max_restarts=process_config.get("max_restarts", 5),
-                    restart_delay=process_config.get("restart_delay", 5),
-                    log_file=process_config.get("log_file"),
-                    redirect_output=process_config.get("redirect_output", True),
-                    cpu_limit=process_config.get("cpu_limit"),
-                    memory_limit=process_config.get("memory_limit"),
-                    alert_on_failure=process_config.get("alert_on_failure", True),
-                    alert_on_high_cpu=process_config.get("alert_on_high_cpu", True),
-                    alert_on_high_memory=process_config.get("alert_on_high_memory", True),
-                    cpu_threshold=process_config.get("cpu_threshold", 80.0),
-                    memory_threshold=process_config.get("memory_threshold", 80.0)
+                kwargs = {
+                    key: value for key, value in process_config.items()
+                    if key in _PROCESS_CONFIG_FIELDS
+                }
+                kwargs["process_type"] = _PROCESS_TYPES.get(
+                    process_config.get("type", "generic"), ProcessType.GENERIC
                 )
 
+                config = ProcessConfig(**kwargs)
+
                 if not config.log_file:
                     config.log_file = self.log_manager.create_log_file(config.name)
 
-                self.process_manager.add_process(config)
-                self.logger.info(f"Loaded process configuration: {config.name}")
+                if self.process_manager.add_process(config):
+                    loaded += 1
 
             except Exception as e:
                 self.logger.error(f"Failed to load process config: {e}")
 
+        self.logger.info(f"Loaded {loaded} process configurations")
+
     async def start(self):
         self.logger.info("Starting ProcessGuard daemon...")
         self.running = True
@@ -137,20 +139,25 @@ class ProcessGuardDaemon:
         await self._cleanup()
 
     async def _monitor_cycle(self):
-        system_metrics = self.system_monitor.get_system_metrics()
+        system_metrics = await self.system_monitor.get_system_metrics_async()
         await self.alert_manager.check_system_alerts(system_metrics)
 
+        blocked = self.process_manager.get_blocked_processes()
+
         for name, process in self.process_manager.get_all_processes().items():
+            if name in blocked:
+                continue
+
             self.process_manager.check_process_health(name)
 
             metrics = self.process_manager.get_process_metrics(name)
             if metrics:
                 await self.alert_manager.check_process_alerts(process, metrics)
 
-                if process.status.value == "running":
+                if self._debug_enabled and process.status.value == "running":
                     self.log_manager.write_log(
                         name,
-                        f"CPU: {metrics.cpu_percent:.1f}%, Memory: {metrics.memory_mb:.1f}MB, Threads: {metrics.threads}",
+                        _METRICS_LOG_TEMPLATE.format(metrics.cpu_percent, metrics.memory_mb, metrics.threads),
                         "DEBUG"
                     )
 
@@ -163,6 +170,9 @@ class ProcessGuardDaemon:
     async def _cleanup(self):
         self.logger.info("Cleaning up...")
         self.process_manager.cleanup()
+        await self.process_manager.close()
+        self.system_monitor.close()
+        self.log_manager.close()
 
     def add_process(self, config: ProcessConfig) -> bool:
         if not config.log_file:
@@ -1,107 +1,338 @@
-import uuid
+import os
+import sys
+import math
+import bisect
+import heapq
 import json
+import time
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
 import aiohttp
 
 from ..utils.logging import get_logger
 
+# Analytics aggregates are bucketed by trace start time at this resolution
+ANALYTICS_BUCKET_SECONDS = 60
+
+# Standard errors above the baseline mean a service's recent average must reach to be flagged
+ANOMALY_Z_THRESHOLD = 3.0
+
+class DurationStats:
+    """Running duration/error totals for a group of completed traces"""
+
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'errors', 'durations')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = float('-inf')
+        self.errors = 0
+        # Sorted durations of the group, so min/max can be recovered when one is removed
+        self.durations: List[float] = []
+
+    def add(self, duration: float, is_error: bool):
+        self.count += 1
+        self.total += duration
+        if duration < self.minimum:
+            self.minimum = duration
+        if duration > self.maximum:
+            self.maximum = duration
+        if is_error:
+            self.errors += 1
+        bisect.insort(self.durations, duration)
+
+    def remove(self, duration: float, is_error: bool):
+        self.count -= 1
+        self.total -= duration
+        if is_error:
+            self.errors -= 1
+        if self.count == 0:
+            self.__init__()
+            return
+
+        durations = self.durations
+        del durations[bisect.bisect_left(durations, duration)]
+        self.minimum = durations[0]
+        self.maximum = durations[-1]
+
+    def merge(self, other: 'DurationStats'):
+        # Merged totals are only reported, so the durations themselves aren't copied
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.errors += other.errors
+
+class OperationStats:
+    """Running totals for root traces of one operation"""
+
+    __slots__ = ('count', 'total', 'services')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.services: Counter = Counter()
+
+    def add(self, duration: float, service: str):
+        self.count += 1
+        self.total += duration
+        self.services[service] += 1
+
+    def remove(self, duration: float, service: str):
+        self.count -= 1
+        self.total -= duration
+        self.services[service] -= 1
+        if not self.services[service]:
+            del self.services[service]
+
+    def merge(self, other: 'OperationStats'):
+        self.count += other.count
+        self.total += other.total
+        self.services.update(other.services)
+
+class ServiceBaseline:
+    """Streaming mean/variance (Welford) over a service's completed traces plus its latest durations"""
+
+    __slots__ = ('count', 'mean', 'm2', 'recent')
+
+    def __init__(self, recent_size: int = 10):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.recent = deque(maxlen=recent_size)
+
+    def add(self, duration: float):
+        self.count += 1
+        delta = duration - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (duration - self.mean)
+        self.recent.append(duration)
+
+    def remove(self, duration: float):
+        """Back out the service's oldest duration, which has left the trace buffer"""
+        if len(self.recent) >= self.count:
+            # Every buffered trace of the service is still in recent, this one first
+            self.recent.popleft()
+
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+
+        self.count -= 1
+        delta = duration - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (duration - self.mean))
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+@dataclass(slots=True)
+class Span:
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    service_name: str
+    operation_name: str
+    start_time: float
+    start_ns: int
+    end_time: Optional[float] = None
+    duration: Optional[float] = None
+    status: str = 'active'
+    error: Optional[str] = None
+    tags: Dict[str, Any] = field(default_factory=dict)
+    logs: List[Dict[str, Any]] = field(default_factory=list)
+    child_spans: List[str] = field(default_factory=list)
+
 class DistributedTracing:
     """Distributed tracing for microservices and service mesh monitoring"""
 
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.active_traces = {}
-        self.completed_traces = deque(maxlen=10000)
+        self.active_traces: Dict[str, Span] = {}
+        self.completed_traces: deque = deque(maxlen=10000)
+        self.span_index: Dict[str, Span] = {}
+        # bucket -> service -> stats, kept in step with completed_traces
+        self.analytics_buckets: Dict[int, Dict[str, DurationStats]] = {}
+        # bucket -> root operation -> stats, for critical path analysis
+        self.root_operation_buckets: Dict[int, Dict[str, OperationStats]] = {}
+        self.service_baselines: Dict[str, ServiceBaseline] = defaultdict(ServiceBaseline)
         self.service_map = defaultdict(set)
         self.dependency_graph = defaultdict(list)
+        self.dependency_edges: Dict[str, set] = defaultdict(set)
 
     async def start_trace(self, service_name: str, operation_name: str,
                          parent_trace_id: Optional[str] = None) -> str:
         """Start a new distributed trace"""
-        trace_id = str(uuid.uuid4())
-        span_id = str(uuid.uuid4())
-
-        trace = {
-            'trace_id': trace_id,
-            'span_id': span_id,
-            'parent_span_id': parent_trace_id,
-            'service_name': service_name,
-            'operation_name': operation_name,
-            'start_time': datetime.now(),
-            'end_time': None,
-            'duration': None,
-            'status': 'active',
-            'tags': {},
-            'logs': [],
-            'child_spans': []
-        }
+        # 16-byte trace and 8-byte span ids, hex encoded as in OpenTelemetry
+        trace_id = os.urandom(16).hex()
+        span_id = os.urandom(8).hex()
+
+        trace = Span(
+            trace_id=trace_id,
+            span_id=span_id,
+            parent_span_id=parent_trace_id,
+            # Few distinct names are shared by thousands of spans; keep one copy of each
+            service_name=sys.intern(service_name),
+            operation_name=sys.intern(operation_name),
+            start_time=time.time(),
+            start_ns=time.monotonic_ns()
+        )
 
         self.active_traces[trace_id] = trace
+        self.span_index[span_id] = trace
         return trace_id
 
     async def finish_trace(self, trace_id: str, status: str = 'success',
                           error: Optional[str] = None):
         """Finish a distributed trace"""
-        if trace_id not in self.active_traces:
+        trace = self.active_traces.pop(trace_id, None)
+        if trace is None:
             return
 
-        trace = self.active_traces[trace_id]
-        trace['end_time'] = datetime.now()
-        trace['duration'] = (trace['end_time'] - trace['start_time']).total_seconds() * 1000
-        trace['status'] = status
-
-        if error:
-            trace['error'] = error
+        self._close_trace(trace, status, error, time.time(), time.monotonic_ns())
 
         # Move to completed traces
-        self.completed_traces.append(trace)
-        del self.active_traces[trace_id]
+        self._store_completed_trace(trace)
 
         # Update service map
         self._update_service_map(trace)
 
+    async def finish_traces_bulk(self, updates: List[Tuple[str, str, Optional[str]]]):
+        """Finish a burst of traces given as (trace_id, status, error) in one pass"""
+        end_time = time.time()
+        end_ns = time.monotonic_ns()
+
+        finished = []
+        for trace_id, status, error in updates:
+            trace = self.active_traces.pop(trace_id, None)
+            if trace is None:
+                continue
+
+            self._close_trace(trace, status, error, end_time, end_ns)
+            self._store_completed_trace(trace)
+            finished.append(trace)
+
+        # One service map update per service rather than per trace
+        operations_by_service = defaultdict(set)
+        for trace in finished:
+            operations_by_service[trace.service_name].add(trace.operation_name)
+        for service, operations in operations_by_service.items():
+            self.service_map[service].update(operations)
+
+        for trace in finished:
+            self._update_dependency_graph(trace)
+
+    def _close_trace(self, trace: Span, status: str, error: Optional[str],
+                     end_time: float, end_ns: int):
+        trace.end_time = end_time
+        trace.duration = (end_ns - trace.start_ns) / 1e6
+        trace.status = status
+
+        if error:
+            trace.error = error
+
+    def _store_completed_trace(self, trace: Span):
+        """Append to completed traces, dropping index entries for the trace the deque evicts"""
+        if len(self.completed_traces) == self.completed_traces.maxlen:
+            evicted = self.completed_traces[0]
+            self.span_index.pop(evicted.span_id, None)
+            self._remove_trace_stats(evicted)
+
+        self.completed_traces.append(trace)
+        self._add_trace_stats(trace)
+
+    def _analytics_bucket(self, trace: Span) -> int:
+        return int(trace.start_time // ANALYTICS_BUCKET_SECONDS)
+
+    def _add_trace_stats(self, trace: Span):
+        bucket = self.analytics_buckets.setdefault(self._analytics_bucket(trace), {})
+        stats = bucket.get(trace.service_name)
+        if stats is None:
+            stats = bucket[trace.service_name] = DurationStats()
+        stats.add(trace.duration, trace.status == 'error')
+        self.service_baselines[trace.service_name].add(trace.duration)
+
+        if not trace.parent_span_id:
+            operations = self.root_operation_buckets.setdefault(self._analytics_bucket(trace), {})
+            operation = operations.get(trace.operation_name)
+            if operation is None:
+                operation = operations[trace.operation_name] = OperationStats()
+            operation.add(trace.duration, trace.service_name)
+
+    def _remove_trace_stats(self, trace: Span):
+        key = self._analytics_bucket(trace)
+        bucket = self.analytics_buckets[key]
+        stats = bucket[trace.service_name]
+        stats.remove(trace.duration, trace.status == 'error')
+        baseline = self.service_baselines[trace.service_name]
+        baseline.remove(trace.duration)
+        if not baseline.count:
+            del self.service_baselines[trace.service_name]
+
+        if not stats.count:
+            del bucket[trace.service_name]
+            if not bucket:
+                del self.analytics_buckets[key]
+
+        if not trace.parent_span_id:
+            operations = self.root_operation_buckets[key]
+            operation = operations[trace.operation_name]
+            operation.remove(trace.duration, trace.service_name)
+
+            if not operation.count:
+                del operations[trace.operation_name]
+                if not operations:
+                    del self.root_operation_buckets[key]
+
     def add_trace_tag(self, trace_id: str, key: str, value: Any):
         """Add tag to trace"""
         if trace_id in self.active_traces:
-            self.active_traces[trace_id]['tags'][key] = value
+            self.active_traces[trace_id].tags[key] = value
 
     def add_trace_log(self, trace_id: str, message: str, level: str = 'info'):
         """Add log entry to trace"""
         if trace_id in self.active_traces:
-            self.active_traces[trace_id]['logs'].append({
-                'timestamp': datetime.now(),
+            self.active_traces[trace_id].logs.append({
+                'timestamp': time.time(),
                 'level': level,
                 'message': message
             })
 
-    def _update_service_map(self, trace: Dict[str, Any]):
+    def _update_service_map(self, trace: Span):
         """Update service dependency map"""
-        service = trace['service_name']
-
         # Add to service map
-        self.service_map[service].add(trace['operation_name'])
-
-        # Update dependency graph
-        if trace.get('parent_span_id'):
-            parent_trace = self._find_parent_trace(trace['parent_span_id'])
-            if parent_trace:
-                parent_service = parent_trace['service_name']
-                if service not in [dep['service'] for dep in self.dependency_graph[parent_service]]:
-                    self.dependency_graph[parent_service].append({
-                        'service': service,
-                        'operation': trace['operation_name'],
-                        'first_seen': datetime.now()
-                    })
-
-    def _find_parent_trace(self, parent_span_id: str) -> Optional[Dict[str, Any]]:
+        self.service_map[trace.service_name].add(trace.operation_name)
+
+        self._update_dependency_graph(trace)
+
+    def _update_dependency_graph(self, trace: Span):
+        """Record the parent service -> service edge for a child trace"""
+        if not trace.parent_span_id:
+            return
+
+        parent_trace = self._find_parent_trace(trace.parent_span_id)
+        if parent_trace:
+            service = trace.service_name
+            parent_service = parent_trace.service_name
+            downstream = self.dependency_edges[parent_service]
+            if service not in downstream:
+                downstream.add(service)
+                self.dependency_graph[parent_service].append({
+                    'service': service,
+                    'operation': trace.operation_name,
+                    'first_seen': datetime.now()
+                })
+
+    def _find_parent_trace(self, parent_span_id: str) -> Optional[Span]:
         """Find parent trace by span ID"""
-        for trace in list(self.completed_traces) + list(self.active_traces.values()):
-            if trace['span_id'] == parent_span_id:
-                return trace
-        return None
+        return self.span_index.get(parent_span_id)
 
     def get_service_map(self) -> Dict[str, Any]:
         """Get service dependency map"""
@@ -112,92 +343,96 @@ class DistributedTracing:
         }
 
     def get_trace_analytics(self, time_window: int = 3600) -> Dict[str, Any]:
-        """Get trace analytics for time window"""
-        cutoff_time = datetime.now() - timedelta(seconds=time_window)
+        """Get trace analytics for time window (resolved to ANALYTICS_BUCKET_SECONDS)"""
+        cutoff_time = time.time() - time_window
+        first_bucket = int(cutoff_time // ANALYTICS_BUCKET_SECONDS)
 
-        recent_traces = [
-            trace for trace in self.completed_traces
-            if trace['start_time'] > cutoff_time
-        ]
+        service_performance: Dict[str, DurationStats] = defaultdict(DurationStats)
+        for bucket, services in self.analytics_buckets.items():
+            if bucket < first_bucket:
+                continue
+            for service, stats in services.items():
+                service_performance[service].merge(stats)
 
-        if not recent_traces:
-            return {'status': 'no_data'}
+        overall = DurationStats()
+        for stats in service_performance.values():
+            overall.merge(stats)
 
-        # Service performance
-        service_performance = defaultdict(list)
-        for trace in recent_traces:
-            service_performance[trace['service_name']].append(trace['duration'])
+        if not overall.count:
+            return {'status': 'no_data'}
 
         service_stats = {}
-        for service, durations in service_performance.items():
+        for service, stats in service_performance.items():
             service_stats[service] = {
-                'avg_duration': sum(durations) / len(durations),
-                'max_duration': max(durations),
-                'min_duration': min(durations),
-                'request_count': len(durations),
-                'error_count': len([t for t in recent_traces
-                                  if t['service_name'] == service and t['status'] == 'error'])
+                'avg_duration': stats.total / stats.count,
+                'max_duration': stats.maximum,
+                'min_duration': stats.minimum,
+                'request_count': stats.count,
+                'error_count': stats.errors
             }
 
         # Critical path analysis
-        critical_paths = self._analyze_critical_paths(recent_traces)
+        root_operations: Dict[str, OperationStats] = defaultdict(OperationStats)
+        for bucket, operations in self.root_operation_buckets.items():
+            if bucket < first_bucket:
+                continue
+            for operation, stats in operations.items():
+                root_operations[operation].merge(stats)
+
+        critical_paths = self._analyze_critical_paths(root_operations)
 
         return {
-            'total_traces': len(recent_traces),
+            'total_traces': overall.count,
             'service_performance': service_stats,
             'critical_paths': critical_paths,
-            'error_rate': len([t for t in recent_traces if t['status'] == 'error']) / len(recent_traces) * 100,
-            'avg_trace_duration': sum(t['duration'] for t in recent_traces) / len(recent_traces)
+            'error_rate': overall.errors / overall.count * 100,
+            'avg_trace_duration': overall.total / overall.count
         }
 
-    def _analyze_critical_paths(self, traces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _analyze_critical_paths(self, root_operations: Dict[str, OperationStats]) -> List[Dict[str, Any]]:
         """Analyze critical paths in distributed traces"""
-        # Group traces by root operation
-        root_traces = defaultdict(list)
-
-        for trace in traces:
-            if not trace.get('parent_span_id'):  # Root trace
-                root_traces[trace['operation_name']].append(trace)
+        slowest = heapq.nlargest(
+            10, root_operations.items(),
+            key=lambda item: item[1].total / item[1].count
+        )
 
-        critical_paths = []
-        for operation, operation_traces in root_traces.items():
-            avg_duration = sum(t['duration'] for t in operation_traces) / len(operation_traces)
-            critical_paths.append({
+        return [
+            {
                 'operation': operation,
-                'avg_duration': avg_duration,
-                'request_count': len(operation_traces),
-                'services_involved': len(set(t['service_name'] for t in operation_traces))
-            })
-
-        return sorted(critical_paths, key=lambda x: x['avg_duration'], reverse=True)[:10]
+                'avg_duration': stats.total / stats.count,
+                'request_count': stats.count,
+                'services_involved': len(stats.services)
+            }
+            for operation, stats in slowest
+        ]
 
     async def detect_service_anomalies(self) -> List[Dict[str, Any]]:
         """Detect anomalies in service behavior"""
         anomalies = []
 
-        # Get recent performance baselines
-        recent_traces = list(self.completed_traces)[-1000:]
-        service_baselines = defaultdict(list)
-
-        for trace in recent_traces:
-            service_baselines[trace['service_name']].append(trace['duration'])
+        for service, baseline in self.service_baselines.items():
+            if baseline.count < 10:  # Need enough data
+                continue
 
-        # Check for anomalies
-        for service, durations in service_baselines.items():
-            if len(durations) < 10:  # Need enough data
+            std = baseline.std
+            if not std:
                 continue
 
-            avg_duration = sum(durations) / len(durations)
-            recent_avg = sum(durations[-10:]) / 10
+            # Score the recent mean against the standard error of a mean of that many samples
+            recent = baseline.recent
+            recent_avg = sum(recent) / len(recent)
+            z_score = (recent_avg - baseline.mean) / (std / math.sqrt(len(recent)))
 
             # Check for performance degradation
-            if recent_avg > avg_duration * 2:  # 100% slower
+            if z_score >= ANOMALY_Z_THRESHOLD:
                 anomalies.append({
                     'type': 'performance_degradation',
                     'service': service,
-                    'baseline_avg': avg_duration,
+                    'baseline_avg': baseline.mean,
+                    'baseline_std': std,
                     'recent_avg': recent_avg,
-                    'severity': 'high' if recent_avg > avg_duration * 3 else 'medium'
+                    'z_score': z_score,
+                    'severity': 'high' if z_score >= ANOMALY_Z_THRESHOLD * 2 else 'medium'
                 })
 
-        return anomalies
\ No newline at end of file
+        return anomalies
@@ -1,13 +1,42 @@
 import os
+import time
+import asyncio
+import contextlib
 import psutil
 import platform
 import socket
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from ..models.system import SystemMetrics, SystemInfo, PortInfo
 from ..utils.logging import get_logger
 
+# Filesystem types backed by real storage; everything else in /proc/mounts is skipped
+DISK_FILESYSTEMS = frozenset({
+    'ext2', 'ext3', 'ext4', 'xfs', 'btrfs', 'zfs', 'ntfs', 'vfat'
+})
+
+_EMPTY_NETWORK_IO = {"bytes_sent": 0, "bytes_recv": 0, "packets_sent": 0, "packets_recv": 0}
+
+# st column value for a listening socket in /proc/net/tcp
+_TCP_LISTEN_STATE = b'0A'
+
+_PRETTY_NAME_PREFIX = b'PRETTY_NAME='
+_PROCESSOR_PREFIX = b'processor'
+_BTIME_PREFIX = b'btime '
+
+def _busy_percent(previous: Optional[Tuple[float, float]], current: Tuple[float, float]) -> float:
+    """Busy CPU percentage between two (total, idle) samples"""
+    if previous is None:
+        return 0.0
+
+    delta_total = current[0] - previous[0]
+    if delta_total <= 0:
+        return 0.0
+
+    delta_idle = current[1] - previous[1]
+    return ((delta_total - delta_idle) / delta_total) * 100
+
 class DockerSystemMonitor:
     """System monitor that works in Docker containers with host system access"""
 
@@ -17,6 +46,27 @@ class DockerSystemMonitor:
         self.host_sys = os.environ.get('HOST_SYS', '/sys')
         self.host_root = os.environ.get('HOST_ROOT', '/')
 
+        # Descriptors for frequently polled /proc files, rewound before each read
+        self._proc_fds: Dict[str, int] = {}
+
+        # Identity of the machine we run on; fixed for the process lifetime
+        self._hostname = socket.gethostname()
+        self._platform_system = platform.system()
+        self._architecture = platform.machine()
+
+        # Host facts that don't change for the container's lifetime, read on first use
+        self._host_static_info: Optional[Dict[str, Any]] = None
+        self._boot_time: Optional[datetime] = None
+
+        # Socket table shared by metrics and the psutil open-port fallback within one poll
+        self._connections_cache: Optional[list] = None
+        self._connections_cached_at = 0.0
+        self._connections_ttl = 1.0
+
+        # Previous (total, idle) CPU time sample for non-blocking CPU percentages
+        self._last_cpu_times: Optional[Tuple[float, float]] = None
+        self._last_host_cpu_times: Optional[Tuple[float, float]] = None
+
         # Check if we're in a container with host access
         self.in_container = os.path.exists('/.dockerenv')
         self.has_host_access = os.path.exists(self.host_proc)
@@ -28,6 +78,15 @@ class DockerSystemMonitor:
         else:
             self.logger.info("Running on host system")
 
+    def close(self):
+        """Close the cached /proc descriptors"""
+        while self._proc_fds:
+            _, fd = self._proc_fds.popitem()
+            try:
+                os.close(fd)
+            except OSError as e:
+                self.logger.error(f"Failed to close /proc descriptor: {e}")
+
     def get_system_info(self) -> SystemInfo:
         if self.in_container and self.has_host_access:
             return self._get_host_system_info()
@@ -37,60 +96,11 @@ class DockerSystemMonitor:
     def _get_host_system_info(self) -> SystemInfo:
         """Get system info from host when running in container"""
         try:
-            # Read host information
-            hostname = socket.gethostname()
-
-            # Try to get host platform info
-            try:
-                with open(f"{self.host_root}/etc/os-release", 'r') as f:
-                    os_info = f.read()
-                    platform_name = "Linux"
-                    for line in os_info.split('\n'):
-                        if line.startswith('PRETTY_NAME='):
-                            platform_name = line.split('=')[1].strip('"')
-                            break
-            except:
-                platform_name = platform.system()
-
-            # CPU count from host
-            try:
-                with open(f"{self.host_proc}/cpuinfo", 'r') as f:
-                    cpu_count = len([line for line in f if line.startswith('processor')])
-            except:
-                cpu_count = psutil.cpu_count()
-
-            # Memory from host
-            try:
-                with open(f"{self.host_proc}/meminfo", 'r') as f:
-                    meminfo = f.read()
-                    for line in meminfo.split('\n'):
-                        if line.startswith('MemTotal:'):
-                            total_memory = int(line.split()[1]) * 1024  # Convert KB to bytes
-                            break
-                    else:
-                        total_memory = psutil.virtual_memory().total
-            except:
-                total_memory = psutil.virtual_memory().total
-
-            # Boot time from host
-            try:
-                with open(f"{self.host_proc}/stat", 'r') as f:
-                    for line in f:
-                        if line.startswith('btime'):
-                            boot_time = datetime.fromtimestamp(int(line.split()[1]))
-                            break
-                    else:
-                        boot_time = datetime.fromtimestamp(psutil.boot_time())
-            except:
-                boot_time = datetime.fromtimestamp(psutil.boot_time())
+            if self._host_static_info is None:
+                self._host_static_info = self._read_host_static_info()
 
             return SystemInfo(
-                hostname=hostname,
-                platform=platform_name,
-                architecture=platform.machine(),
-                cpu_count=cpu_count,
-                total_memory=total_memory,
-                boot_time=boot_time,
+                **self._host_static_info,
                 open_ports=self.get_open_ports()
             )
 
@@ -98,17 +108,60 @@ class DockerSystemMonitor:
             self.logger.error(f"Failed to get host system info: {e}")
             return self._get_container_system_info()
 
+    def _read_host_static_info(self) -> Dict[str, Any]:
+        """Read host facts that stay fixed while the container runs"""
+        platform_name = cpu_count = total_memory = boot_time = None
+
+        # Host platform info; a readable os-release without PRETTY_NAME is plain Linux
+        with contextlib.suppress(OSError, UnicodeDecodeError):
+            pretty_name = self._read_prefixed_value(f"{self.host_root}/etc/os-release", _PRETTY_NAME_PREFIX)
+            platform_name = pretty_name.strip(b'"').decode() if pretty_name is not None else "Linux"
+
+        # CPU count from host
+        with contextlib.suppress(OSError):
+            with open(f"{self.host_proc}/cpuinfo", 'rb') as f:
+                cpu_count = sum(1 for line in f if line.startswith(_PROCESSOR_PREFIX)) or None
+
+        # Memory from host
+        with contextlib.suppress(OSError, ValueError, IndexError):
+            total_memory = self._parse_host_meminfo()['total'] or None
+
+        # Boot time from host
+        with contextlib.suppress(OSError, ValueError):
+            btime = self._read_prefixed_value(f"{self.host_proc}/stat", _BTIME_PREFIX)
+            if btime is not None:
+                boot_time = datetime.fromtimestamp(int(btime))
+
+        # Fall back to psutil only for whatever the host files couldn't supply
+        return {
+            'hostname': self._hostname,
+            'platform': platform_name or self._platform_system,
+            'architecture': self._architecture,
+            'cpu_count': cpu_count or psutil.cpu_count(),
+            'total_memory': total_memory or psutil.virtual_memory().total,
+            'boot_time': boot_time or datetime.fromtimestamp(psutil.boot_time())
+        }
+
+    def _read_prefixed_value(self, path: str, prefix: bytes) -> Optional[bytes]:
+        """Return the rest of the first line in path starting with prefix, or None"""
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.startswith(prefix):
+                    return line[len(prefix):].strip()
+        return None
+
     def _get_container_system_info(self) -> SystemInfo:
         """Fallback to container system info"""
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
+        if self._boot_time is None:
+            self._boot_time = datetime.fromtimestamp(psutil.boot_time())
 
         return SystemInfo(
-            hostname=socket.gethostname(),
-            platform=platform.system(),
-            architecture=platform.machine(),
+            hostname=self._hostname,
+            platform=self._platform_system,
+            architecture=self._architecture,
             cpu_count=psutil.cpu_count(),
             total_memory=psutil.virtual_memory().total,
-            boot_time=boot_time,
+            boot_time=self._boot_time,
             open_ports=self.get_open_ports()
         )
 
@@ -118,6 +171,14 @@ class DockerSystemMonitor:
         else:
             return self._get_container_system_metrics()
 
+    async def get_system_info_async(self) -> SystemInfo:
+        """get_system_info on the default executor so /proc reads don't block the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_system_info)
+
+    async def get_system_metrics_async(self) -> SystemMetrics:
+        """get_system_metrics on the default executor so /proc reads don't block the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_system_metrics)
+
     def _get_host_system_metrics(self) -> SystemMetrics:
         """Get system metrics from host when running in container"""
         try:
@@ -131,7 +192,7 @@ class DockerSystemMonitor:
             disk_usage = self._get_host_disk_usage()
 
             # Network I/O
-            network_io = self._get_host_network_io()
+            network_io = self._get_network_io()
 
             # Load average
             load_average = self._get_host_load_average()
@@ -140,7 +201,7 @@ class DockerSystemMonitor:
             uptime = self._get_host_uptime()
 
             # Active connections
-            active_connections = len(psutil.net_connections())
+            active_connections = len(self._get_net_connections())
 
             return SystemMetrics(
                 timestamp=datetime.now(),
@@ -176,13 +237,13 @@ class DockerSystemMonitor:
             except (PermissionError, OSError):
                 continue
 
-        network_io = psutil.net_io_counters()._asdict()
-        active_connections = len(psutil.net_connections())
+        network_io = self._get_network_io()
+        active_connections = len(self._get_net_connections())
         uptime = (datetime.now() - datetime.fromtimestamp(psutil.boot_time())).total_seconds()
 
         return SystemMetrics(
             timestamp=datetime.now(),
-            cpu_percent=psutil.cpu_percent(interval=1),
+            cpu_percent=self._get_container_cpu_percent(),
             memory_percent=memory.percent,
             memory_total=memory.total,
             memory_available=memory.available,
@@ -193,48 +254,48 @@ class DockerSystemMonitor:
             active_connections=active_connections
         )
 
+    def _get_container_cpu_percent(self) -> float:
+        """CPU percentage since the previous poll, without blocking; 0.0 on the first call"""
+        cpu_times = psutil.cpu_times()
+        # Linux already counts guest and guest_nice time inside user and nice
+        total = sum(cpu_times) - getattr(cpu_times, 'guest', 0.0) - getattr(cpu_times, 'guest_nice', 0.0)
+        sample = (total, cpu_times.idle + getattr(cpu_times, 'iowait', 0.0))
+
+        previous, self._last_cpu_times = self._last_cpu_times, sample
+        return _busy_percent(previous, sample)
+
     def _get_host_cpu_percent(self) -> float:
-        """Get CPU percentage from host /proc/stat"""
+        """CPU percentage from host /proc/stat since the previous poll; 0.0 on the first call"""
         try:
-            with open(f"{self.host_proc}/stat", 'r') as f:
-                cpu_line = f.readline()
-                cpu_values = list(map(int, cpu_line.split()[1:]))
-
-                idle = cpu_values[3]
-                total = sum(cpu_values)
+            stat = self._read_host_proc('stat')
+            cpu_line = stat[:stat.index(b'\n')]
 
-                # Simple calculation (not as accurate as psutil's interval-based calculation)
-                if total > 0:
-                    return ((total - idle) / total) * 100
-                return 0.0
+            # user nice system idle iowait irq softirq steal; guest time is already counted in user
+            cpu_values = [int(value) for value in cpu_line.split()[1:9]]
+            sample = (sum(cpu_values), cpu_values[3] + cpu_values[4])
         except:
             return psutil.cpu_percent()
 
+        previous, self._last_host_cpu_times = self._last_host_cpu_times, sample
+        return _busy_percent(previous, sample)
+
     def _get_host_memory_stats(self) -> Dict[str, int]:
         """Get memory stats from host /proc/meminfo"""
         try:
-            with open(f"{self.host_proc}/meminfo", 'r') as f:
-                meminfo = {}
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        key = parts[0].rstrip(':')
-                        value = int(parts[1]) * 1024  # Convert KB to bytes
-                        meminfo[key] = value
-
-                total = meminfo.get('MemTotal', 0)
-                available = meminfo.get('MemAvailable', meminfo.get('MemFree', 0))
-
-                if total > 0:
-                    percent = ((total - available) / total) * 100
-                else:
-                    percent = 0.0
-
-                return {
-                    'total': total,
-                    'available': available,
-                    'percent': percent
-                }
+            meminfo = self._parse_host_meminfo()
+            total = meminfo['total']
+            available = meminfo['available']
+
+            if total > 0:
+                percent = ((total - available) / total) * 100
+            else:
+                percent = 0.0
+
+            return {
+                'total': total,
+                'available': available,
+                'percent': percent
+            }
         except:
             memory = psutil.virtual_memory()
             return {
@@ -243,28 +304,94 @@ class DockerSystemMonitor:
                 'percent': memory.percent
             }
 
+    def _parse_host_meminfo(self) -> Dict[str, int]:
+        """Pull MemTotal and MemAvailable (or MemFree) out of /proc/meminfo in bytes"""
+        total = available = free = None
+
+        # The wanted keys are at the top of the file, so stop as soon as they're seen
+        for line in self._read_host_proc('meminfo').splitlines():
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1]) * 1024  # Convert KB to bytes
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1]) * 1024
+            elif line.startswith(b'MemFree:'):
+                free = int(line.split()[1]) * 1024
+
+            if total is not None and available is not None:
+                break
+
+        if available is None:
+            available = free
+
+        return {
+            'total': total or 0,
+            'available': available or 0
+        }
+
+    def _read_host_proc(self, name: str) -> bytes:
+        """Read a host /proc file through a cached descriptor"""
+        fd = self._proc_fds.get(name)
+        if fd is None:
+            fd = os.open(f"{self.host_proc}/{name}", os.O_RDONLY)
+            cached = self._proc_fds.setdefault(name, fd)
+            if cached != fd:
+                # Another executor thread opened it first
+                os.close(fd)
+                fd = cached
+
+        try:
+            # /proc regenerates the content when read from offset 0; pread keeps
+            # concurrent readers from racing on the shared file position
+            chunks = []
+            offset = 0
+            while True:
+                chunk = os.pread(fd, 65536, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+            return b''.join(chunks)
+        except OSError:
+            if self._proc_fds.pop(name, None) == fd:
+                os.close(fd)
+            raise
+
     def _get_host_disk_usage(self) -> Dict[str, Dict[str, Any]]:
         """Get disk usage from host filesystem"""
         disk_usage = {}
         try:
             # Read mounts from host
+            seen_devices = set()
             with open(f"{self.host_proc}/mounts", 'r') as f:
                 for line in f:
                     parts = line.split()
-                    if len(parts) >= 2:
-                        device, mountpoint = parts[0], parts[1]
-                        if mountpoint.startswith('/') and not mountpoint.startswith('/proc'):
-                            try:
-                                host_path = f"{self.host_root}{mountpoint}" if mountpoint != '/' else self.host_root
-                                usage = psutil.disk_usage(host_path)
-                                disk_usage[mountpoint] = {
-                                    "total": usage.total,
-                                    "used": usage.used,
-                                    "free": usage.free,
-                                    "percent": (usage.used / usage.total) * 100
-                                }
-                            except (PermissionError, OSError):
-                                continue
+                    if len(parts) < 3:
+                        continue
+
+                    device, mountpoint, fs_type = parts[0], parts[1], parts[2]
+
+                    # Skip virtual filesystems and bind mounts of a device already counted
+                    if fs_type not in DISK_FILESYSTEMS or device in seen_devices:
+                        continue
+                    seen_devices.add(device)
+
+                    try:
+                        host_path = f"{self.host_root}{mountpoint}" if mountpoint != '/' else self.host_root
+                        stat = os.statvfs(host_path)
+                    except (PermissionError, OSError):
+                        continue
+
+                    total = stat.f_blocks * stat.f_frsize
+                    if not total:
+                        continue
+
+                    used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+                    disk_usage[mountpoint] = {
+                        "total": total,
+                        "used": used,
+                        "free": stat.f_bavail * stat.f_frsize,
+                        "percent": (used / total) * 100
+                    }
         except:
             # Fallback to container disk usage
             for partition in psutil.disk_partitions():
@@ -281,38 +408,135 @@ class DockerSystemMonitor:
 
         return disk_usage
 
-    def _get_host_network_io(self) -> Dict[str, int]:
-        """Get network I/O stats from host"""
-        try:
-            network_io = psutil.net_io_counters()._asdict()
-            return network_io
-        except:
-            return {"bytes_sent": 0, "bytes_recv": 0, "packets_sent": 0, "packets_recv": 0}
+    def _get_network_io(self) -> Dict[str, int]:
+        """Get network I/O counters; shared by the host and container paths"""
+        counters = psutil.net_io_counters()
+        if counters is None:
+            # psutil returns None when the host has no network interfaces
+            return dict(_EMPTY_NETWORK_IO)
+        return counters._asdict()
 
     def _get_host_load_average(self) -> List[float]:
         """Get load average from host"""
         try:
-            with open(f"{self.host_proc}/loadavg", 'r') as f:
-                load_avg = f.read().split()[:3]
-                return [float(x) for x in load_avg]
+            load_avg = self._read_host_proc('loadavg').split()[:3]
+            return [float(x) for x in load_avg]
         except:
             return psutil.getloadavg() if hasattr(psutil, 'getloadavg') else [0.0, 0.0, 0.0]
 
     def _get_host_uptime(self) -> float:
         """Get uptime from host"""
         try:
-            with open(f"{self.host_proc}/uptime", 'r') as f:
-                uptime = float(f.read().split()[0])
-                return uptime
+            return float(self._read_host_proc('uptime').split()[0])
         except:
             return (datetime.now() - datetime.fromtimestamp(psutil.boot_time())).total_seconds()
 
+    def _get_net_connections(self) -> list:
+        """Get inet sockets, reusing the last scan if it is younger than the TTL"""
+        now = time.monotonic()
+        if self._connections_cache is None or now - self._connections_cached_at > self._connections_ttl:
+            self._connections_cache = psutil.net_connections(kind='inet')
+            self._connections_cached_at = now
+        return self._connections_cache
+
     def get_open_ports(self) -> List[PortInfo]:
         """Get open ports (works the same in container)"""
+        try:
+            listeners = self._read_tcp_listeners()
+        except OSError:
+            return self._get_open_ports_psutil()
+
+        socket_pids = self._find_socket_owners({inode for _, inode in listeners})
+        process_names: Dict[int, str] = {}
+
+        ports = []
+        for port, inode in listeners:
+            pid = socket_pids.get(inode, 0)
+            if pid and pid not in process_names:
+                process_names[pid] = self._read_process_name(pid)
+
+            ports.append(PortInfo(
+                port=port,
+                protocol="TCP",
+                process_name=process_names.get(pid, "unknown"),
+                pid=pid,
+                status=psutil.CONN_LISTEN
+            ))
+
+        return sorted(ports, key=lambda x: x.port)
+
+    def _read_tcp_listeners(self) -> List[Tuple[int, int]]:
+        """Get (port, socket inode) for listening TCP sockets straight from /proc/net"""
+        listeners = []
+        for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+            try:
+                with open(table, 'rb') as f:
+                    next(f, None)  # header
+                    for line in f:
+                        fields = line.split()
+                        if fields[3] == _TCP_LISTEN_STATE:
+                            port = int(fields[1].rpartition(b':')[2], 16)
+                            listeners.append((port, int(fields[9])))
+            except FileNotFoundError:
+                # tcp6 is absent when IPv6 is disabled
+                if table == '/proc/net/tcp':
+                    raise
+        return listeners
+
+    def _find_socket_owners(self, inodes: set) -> Dict[int, int]:
+        """Map socket inodes to owning pids with one pass over /proc/*/fd"""
+        owners: Dict[int, int] = {}
+        if not inodes:
+            return owners
+
+        with os.scandir('/proc') as proc_entries:
+            for proc_entry in proc_entries:
+                if not proc_entry.name.isdigit():
+                    continue
+
+                pid = int(proc_entry.name)
+                try:
+                    with os.scandir(f"/proc/{pid}/fd") as fd_entries:
+                        for fd_entry in fd_entries:
+                            try:
+                                target = os.readlink(fd_entry.path)
+                            except OSError:
+                                continue
+
+                            if target.startswith('socket:['):
+                                inode = int(target[8:-1])
+                                if inode in inodes and inode not in owners:
+                                    owners[inode] = pid
+                except OSError:
+                    # Process exited or its fds aren't visible to us
+                    continue
+
+                if len(owners) == len(inodes):
+                    break
+
+        return owners
+
+    def _read_process_name(self, pid: int) -> str:
+        try:
+            with open(f"/proc/{pid}/comm", 'rb') as f:
+                name = f.read().strip().decode(errors='replace')
+
+            # comm is truncated to 15 characters; recover the full name from argv[0] like psutil does
+            if len(name) >= 15:
+                with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                    executable = os.path.basename(f.read().split(b'\0', 1)[0]).decode(errors='replace')
+                if executable.startswith(name):
+                    name = executable
+
+            return name or "unknown"
+        except OSError:
+            return "unknown"
+
+    def _get_open_ports_psutil(self) -> List[PortInfo]:
+        """Fallback for systems without a Linux /proc/net"""
         ports = []
-        connections = psutil.net_connections(kind='inet')
 
-        for conn in connections:
+        for conn in self._get_net_connections():
             if conn.status == psutil.CONN_LISTEN and conn.laddr:
                 try:
                     process = psutil.Process(conn.pid) if conn.pid else None
@@ -328,4 +552,4 @@ class DockerSystemMonitor:
                     status=conn.status
                 ))
 
-        return sorted(ports, key=lambda x: x.port)
\ No newline at end of file
+        return sorted(ports, key=lambda x: x.port)
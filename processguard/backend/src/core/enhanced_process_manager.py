@@ -2,20 +2,76 @@ import subprocess
 import psutil
 import time
 import os
+import re
+import sys
+import json
+import random
 import signal
 import logging
 import asyncio
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from collections import Counter, deque
+from datetime import datetime
 from pathlib import Path
+from dataclasses import asdict, dataclass
 
 from .process_manager import ProcessManager
 from .nodejs_monitor import NodeJSMonitor
 from .react_dev_monitor import ReactDevMonitor
 from .crash_manager import CrashManager, CrashPolicy, CrashAction
+from .log_manager import read_tail_lines
 from ..models.process import ManagedProcess, ProcessConfig, ProcessStatus, ProcessMetrics, ProcessType
 from ..utils.logging import get_logger
 
+CRASH_HISTORY_MAXLEN = 1000
+CRASH_HISTORY_RETENTION_SECONDS = 24 * 3600
+RECENT_CRASH_WINDOW_SECONDS = 3600
+METRICS_CACHE_TTL_SECONDS = 0.5
+RESTART_BACKOFF_MAX_SECONDS = 300
+RESTART_BACKOFF_JITTER_SECONDS = 5.0
+
+REACT_DEV_INDICATORS = (
+    'react-scripts start',
+    'npm start',
+    'yarn start',
+    'webpack-dev-server',
+    'next dev',
+    'vite'
+)
+_REACT_DEV_PATTERN = re.compile('|'.join(map(re.escape, REACT_DEV_INDICATORS)), re.IGNORECASE)
+
+@dataclass(slots=True)
+class CrashRecord:
+    recorded_at_ts: float
+    type: str
+    pattern: str
+    line: str
+    timestamp: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.type,
+            'pattern': self.pattern,
+            'line': self.line,
+            'timestamp': self.timestamp,
+            'recorded_at': datetime.fromtimestamp(self.recorded_at_ts).isoformat(),
+            'recorded_at_ts': self.recorded_at_ts
+        }
+
+@dataclass(slots=True)
+class HealthIssue:
+    type: str
+    message_template: str
+    value: Any
+    severity: str = 'warning'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.type,
+            'message': self.message_template.format(self.value),
+            'severity': self.severity
+        }
+
 class EnhancedProcessManager(ProcessManager):
     """Enhanced process manager with Node.js and React specific features"""
 
@@ -24,47 +80,101 @@ class EnhancedProcessManager(ProcessManager):
         self.nodejs_monitor = NodeJSMonitor()
         self.react_monitor = ReactDevMonitor()
         self.crash_manager = CrashManager()
-        self.crash_history: Dict[str, List[Dict]] = {}
+        self.crash_history: Dict[str, Deque[CrashRecord]] = {}
+        self._react_dev_cache: Dict[str, bool] = {}
+        self._package_json_cache: Dict[str, Tuple[int, Dict]] = {}
+        self._type_counts: Counter = Counter()
+        self._recent_crash_times: Deque[float] = deque()
+        self._metrics_cache: Dict[str, Tuple[float, ProcessMetrics]] = {}
+        self._log_tail_cache: Dict[str, Tuple[int, int, int, List[str]]] = {}
         self.logger = get_logger(__name__)
 
+    def add_process(self, config: ProcessConfig) -> bool:
+        added = super().add_process(config)
+        if added:
+            self._react_dev_cache.pop(config.name, None)
+            self._type_counts[self._get_dev_type(self.processes[config.name])] += 1
+        return added
+
+    def remove_process(self, name: str) -> bool:
+        process = self.processes.get(name)
+        removed = super().remove_process(name)
+        if removed:
+            self._type_counts[self._get_dev_type(process)] -= 1
+            self._react_dev_cache.pop(name, None)
+            self._metrics_cache.pop(name, None)
+            if process.config.log_file:
+                self._log_tail_cache.pop(process.config.log_file, None)
+        return removed
+
+    def get_process_metrics(self, name: str) -> Optional[ProcessMetrics]:
+        """Get process metrics, reusing a sample taken within the last sweep"""
+        process = self.processes.get(name)
+        if process is None:
+            return None
+
+        now = time.monotonic()
+        cached = self._metrics_cache.get(name)
+        if cached and now - cached[0] < METRICS_CACHE_TTL_SECONDS and cached[1].pid == process.pid:
+            return cached[1]
+
+        metrics = super().get_process_metrics(name)
+        if metrics is not None:
+            self._metrics_cache[name] = (now, metrics)
+        return metrics
+
     async def get_enhanced_process_metrics(self, name: str) -> Optional[Dict]:
         """Get enhanced metrics including Node.js/React specific data"""
-        if name not in self.processes:
+        process = self.processes.get(name)
+        if process is None:
             return None
 
-        process = self.processes[name]
         base_metrics = self.get_process_metrics(name)
 
         if not base_metrics:
             return None
 
         enhanced_metrics = {
-            'base_metrics': base_metrics.__dict__,
-            'crash_history': self.crash_history.get(name, []),
+            'base_metrics': asdict(base_metrics),
+            'crash_history': self._serialize_crash_history(name),
             'restart_recommendations': []
         }
 
+        # React dev servers are Node.js processes; anything else only gets base metrics
+        if process.config.process_type != ProcessType.NODEJS:
+            return enhanced_metrics
+
+        is_react = self._is_react_dev_server(process)
+
+        # The log tail (read once for both detectors) and the monitor metrics are independent
+        connections = self.get_cached_connections(name)
+        pending = [
+            self._get_recent_logs(name),
+            self.nodejs_monitor.get_nodejs_metrics(process, connections)
+        ]
+        if is_react:
+            pending.append(self.react_monitor.get_react_dev_metrics(process, connections))
+        results = await asyncio.gather(*pending)
+        log_lines = results[0]
+
         # Add Node.js specific metrics
-        if process.config.process_type == ProcessType.NODEJS:
-            enhanced_metrics['nodejs_metrics'] = await self.nodejs_monitor.get_nodejs_metrics(process)
+        enhanced_metrics['nodejs_metrics'] = results[1]
 
-            # Check for Node.js crashes
-            log_lines = self._get_recent_logs(name)
-            nodejs_crashes = self.nodejs_monitor.detect_nodejs_crashes(process, log_lines)
-            if nodejs_crashes:
-                self._record_crashes(name, nodejs_crashes)
-                enhanced_metrics['nodejs_crashes'] = nodejs_crashes
+        # Check for Node.js crashes
+        nodejs_crashes = self.nodejs_monitor.detect_nodejs_crashes(process, log_lines)
+        if nodejs_crashes:
+            self._record_crashes(name, nodejs_crashes)
+            enhanced_metrics['nodejs_crashes'] = nodejs_crashes
 
-                # Get restart strategy
-                restart_strategy = self.nodejs_monitor.get_restart_strategy(process, nodejs_crashes)
-                enhanced_metrics['restart_strategy'] = restart_strategy
+            # Get restart strategy
+            restart_strategy = self.nodejs_monitor.get_restart_strategy(process, nodejs_crashes)
+            enhanced_metrics['restart_strategy'] = restart_strategy
 
         # Add React dev server specific metrics
-        if self._is_react_dev_server(process):
-            enhanced_metrics['react_dev_metrics'] = await self.react_monitor.get_react_dev_metrics(process)
+        if is_react:
+            enhanced_metrics['react_dev_metrics'] = results[2]
 
             # Check for React dev issues
-            log_lines = self._get_recent_logs(name)
             react_issues = self.react_monitor.detect_react_dev_issues(process, log_lines)
             if react_issues:
                 enhanced_metrics['react_issues'] = react_issues
@@ -77,21 +187,32 @@ class EnhancedProcessManager(ProcessManager):
 
         return enhanced_metrics
 
+    async def close(self):
+        """Close the React monitor's HTTP session and reader workers"""
+        await self.react_monitor.close()
+
+    def get_blocked_processes(self) -> Set[str]:
+        """Get processes held back by crash policy (disabled or quarantined)"""
+        return self.crash_manager.get_blocked_processes()
+
     def _is_react_dev_server(self, process: ManagedProcess) -> bool:
         """Check if process is a React development server"""
-        command = process.config.command.lower()
-        react_indicators = [
-            'react-scripts start',
-            'npm start',
-            'yarn start',
-            'webpack-dev-server',
-            'next dev',
-            'vite'
-        ]
+        name = process.config.name
+        cached = self._react_dev_cache.get(name)
+        if cached is not None:
+            return cached
 
-        return any(indicator in command for indicator in react_indicators)
+        is_react = _REACT_DEV_PATTERN.search(process.config.command) is not None
+        self._react_dev_cache[name] = is_react
+        return is_react
 
-    def _get_recent_logs(self, process_name: str, lines: int = 100) -> List[str]:
+    def _get_dev_type(self, process: ManagedProcess) -> str:
+        """Categorize process for the development summary"""
+        if process.config.process_type == ProcessType.NODEJS:
+            return 'react_dev' if self._is_react_dev_server(process) else 'nodejs'
+        return 'other'
+
+    async def _get_recent_logs(self, process_name: str, lines: int = 100) -> List[str]:
         """Get recent log lines for a process"""
         try:
             if process_name not in self.processes:
@@ -100,64 +221,111 @@ class EnhancedProcessManager(ProcessManager):
             process = self.processes[process_name]
             log_file = process.config.log_file
 
-            if not log_file or not os.path.exists(log_file):
+            if not log_file:
                 return []
 
-            with open(log_file, 'r') as f:
-                all_lines = f.readlines()
-                return [line.strip() for line in all_lines[-lines:]]
+            return await asyncio.get_running_loop().run_in_executor(None, self._read_log_tail, log_file, lines)
+
+        except (FileNotFoundError, PermissionError):
+            return []
 
         except Exception as e:
             self.logger.error(f"Failed to read logs for {process_name}: {e}")
             return []
 
+    def _read_log_tail(self, log_file: str, lines: int) -> List[str]:
+        """Get stripped tail lines, reusing the previous read while the file is unchanged"""
+        st = os.stat(log_file)
+        cached = self._log_tail_cache.get(log_file)
+        if cached and cached[:3] == (st.st_size, st.st_mtime_ns, lines):
+            return cached[3]
+
+        tail = [line.strip() for line in read_tail_lines(log_file, lines)]
+        self._log_tail_cache[log_file] = (st.st_size, st.st_mtime_ns, lines, tail)
+        return tail
+
     def _record_crashes(self, process_name: str, crashes: List[Dict]):
         """Record crash information for analysis"""
-        if process_name not in self.crash_history:
-            self.crash_history[process_name] = []
+        history = self.crash_history.get(process_name)
+        if history is None:
+            history = self.crash_history[process_name] = deque(maxlen=CRASH_HISTORY_MAXLEN)
 
+        now = time.time()
         for crash in crashes:
-            crash['recorded_at'] = datetime.now().isoformat()
-            self.crash_history[process_name].append(crash)
+            history.append(CrashRecord(
+                recorded_at_ts=now,
+                type=sys.intern(crash.get('type', '')),
+                pattern=sys.intern(crash.get('pattern', '')),
+                line=crash.get('line', ''),
+                timestamp=crash.get('timestamp')
+            ))
+            self._recent_crash_times.append(now)
+        self._trim_recent_crash_times(now)
 
         # Keep only recent crashes (last 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        self.crash_history[process_name] = [
-            crash for crash in self.crash_history[process_name]
-            if datetime.fromisoformat(crash['recorded_at']) > cutoff_time
-        ]
+        cutoff = now - CRASH_HISTORY_RETENTION_SECONDS
+        while history and history[0].recorded_at_ts < cutoff:
+            history.popleft()
+
+    def _trim_recent_crash_times(self, now: float):
+        """Drop crash times older than the summary's recent-crash window"""
+        recent_crash_times = self._recent_crash_times
+        cutoff = now - RECENT_CRASH_WINDOW_SECONDS
+        while recent_crash_times and recent_crash_times[0] <= cutoff:
+            recent_crash_times.popleft()
+
+    def _get_recent_crashes(self, process_name: str, window_seconds: float) -> List[CrashRecord]:
+        """Get crashes recorded within the given window, oldest first"""
+        history = self.crash_history.get(process_name)
+        if not history:
+            return []
+
+        cutoff = time.time() - window_seconds
+        recent = []
+        for record in reversed(history):
+            if record.recorded_at_ts <= cutoff:
+                break
+            recent.append(record)
+
+        recent.reverse()
+        return recent
+
+    def _serialize_crash_history(self, process_name: str) -> List[Dict]:
+        """Get crash history with ISO timestamps for API consumers"""
+        return [record.to_dict() for record in self.crash_history.get(process_name, ())]
 
     async def intelligent_restart(self, name: str) -> bool:
         """Restart process with intelligent strategy based on crash analysis"""
-        if name not in self.processes:
+        process = self.processes.get(name)
+        if process is None:
             return False
 
         # Check crash manager policies first
-        can_restart, reason = self.crash_manager.can_restart_process(name)
+        crash_manager = self.crash_manager
+        can_restart, reason = crash_manager.can_restart_process(name)
         if not can_restart:
             self.logger.warning(f"Cannot restart {name}: {reason}")
             return False
 
-        process = self.processes[name]
-
         # Record the restart attempt
-        await self.crash_manager.record_crash(name, "restart_requested")
+        await crash_manager.record_crash(name, "restart_requested")
 
         # Get crash history and determine strategy
-        crashes = self.crash_history.get(name, [])
-        recent_crashes = [
-            crash for crash in crashes
-            if datetime.fromisoformat(crash['recorded_at']) > datetime.now() - timedelta(minutes=10)
-        ]
+        recent_crashes = self._get_recent_crashes(name, 600)
 
-        # If too many recent crashes, use longer delay
+        # If too many recent crashes, back off exponentially with jitter so
+        # processes that crashed together do not restart in lockstep
         if len(recent_crashes) > 3:
-            self.logger.warning(f"Too many recent crashes for {name}, using extended delay")
-            await asyncio.sleep(30)
+            delay = min(RESTART_BACKOFF_MAX_SECONDS, 2 ** min(len(recent_crashes), 8))
+            delay += random.uniform(0, RESTART_BACKOFF_JITTER_SECONDS)
+            self.logger.warning(f"Too many recent crashes for {name}, backing off {delay:.1f}s")
+            await asyncio.sleep(delay)
 
         # For Node.js processes, use intelligent restart strategy
         if process.config.process_type == ProcessType.NODEJS and recent_crashes:
-            restart_strategy = self.nodejs_monitor.get_restart_strategy(process, recent_crashes)
+            restart_strategy = self.nodejs_monitor.get_restart_strategy(
+                process, [record.to_dict() for record in recent_crashes]
+            )
 
             if restart_strategy['action'] == 'no_restart':
                 self.logger.warning(f"Not restarting {name}: {restart_strategy['reason']}")
@@ -227,9 +395,7 @@ class EnhancedProcessManager(ProcessManager):
         # Auto-detect React app type
         if package_json.exists():
             try:
-                import json
-                with open(package_json, 'r') as f:
-                    package_data = json.load(f)
+                package_data = self._load_package_json(package_json)
 
                 dependencies = package_data.get('dependencies', {})
                 dev_dependencies = package_data.get('devDependencies', {})
@@ -287,6 +453,19 @@ class EnhancedProcessManager(ProcessManager):
 
         return success and self.start_process(name)
 
+    def _load_package_json(self, path: Path) -> Dict:
+        """Load package.json, reusing the parsed result while the file is unchanged"""
+        key = str(path)
+        mtime_ns = path.stat().st_mtime_ns
+
+        cached = self._package_json_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        package_data = json.loads(path.read_bytes())
+        self._package_json_cache[key] = (mtime_ns, package_data)
+        return package_data
+
     async def check_development_health(self) -> Dict[str, Any]:
         """Check health of all development processes"""
         health_report = {
@@ -298,43 +477,54 @@ class EnhancedProcessManager(ProcessManager):
             'overall_status': 'healthy'
         }
 
+        running = []
         for name, process in self.processes.items():
             if process.status == ProcessStatus.RUNNING:
-                health_report['running_processes'] += 1
-
-                # Check for specific issues
-                issues = []
-
-                # Get enhanced metrics
-                metrics = await self.get_enhanced_process_metrics(name)
-
-                if metrics:
-                    # Check for React dev issues
-                    if 'react_issues' in metrics:
-                        issues.extend(metrics['react_issues'])
-
-                    # Check for Node.js crashes
-                    if 'nodejs_crashes' in metrics:
-                        issues.extend(metrics['nodejs_crashes'])
-
-                    # Check for high restart count
-                    if process.restart_count > 5:
-                        issues.append({
-                            'type': 'high_restart_count',
-                            'message': f"Process has restarted {process.restart_count} times",
-                            'severity': 'warning'
-                        })
-
-                if issues:
-                    health_report['processes_with_issues'].append({
-                        'name': name,
-                        'issues': issues,
-                        'issue_count': len(issues)
-                    })
-
+                running.append((name, process))
             elif process.status == ProcessStatus.FAILED:
                 health_report['failed_processes'] += 1
 
+        health_report['running_processes'] = len(running)
+
+        # Gather enhanced metrics for all running processes concurrently
+        results = await asyncio.gather(
+            *(self.get_enhanced_process_metrics(name) for name, _ in running),
+            return_exceptions=True
+        )
+
+        for (name, process), metrics in zip(running, results):
+            # Check for specific issues
+            issues = []
+
+            if isinstance(metrics, Exception):
+                self.logger.error(f"Failed to get enhanced metrics for {name}: {metrics}")
+                issues.append(HealthIssue('metrics_unavailable', "Failed to collect metrics: {}", metrics))
+
+            elif metrics:
+                # Check for React dev issues
+                if 'react_issues' in metrics:
+                    issues.extend(metrics['react_issues'])
+
+                # Check for Node.js crashes
+                if 'nodejs_crashes' in metrics:
+                    issues.extend(metrics['nodejs_crashes'])
+
+                # Check for high restart count
+                if process.restart_count > 5:
+                    issues.append(HealthIssue(
+                        'high_restart_count', "Process has restarted {} times", process.restart_count
+                    ))
+
+            if issues:
+                health_report['processes_with_issues'].append({
+                    'name': name,
+                    'issues': [
+                        issue.to_dict() if isinstance(issue, HealthIssue) else issue
+                        for issue in issues
+                    ],
+                    'issue_count': len(issues)
+                })
+
         # Determine overall status
         if health_report['failed_processes'] > 0:
             health_report['overall_status'] = 'critical'
@@ -345,8 +535,9 @@ class EnhancedProcessManager(ProcessManager):
 
     def get_development_summary(self) -> Dict[str, Any]:
         """Get summary of development environment"""
+        processes = self.processes
         summary = {
-            'total_processes': len(self.processes),
+            'total_processes': len(processes),
             'by_type': {
                 'nodejs': 0,
                 'react_dev': 0,
@@ -362,31 +553,28 @@ class EnhancedProcessManager(ProcessManager):
         }
 
         # Count recent crashes across all processes
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        for process_name, crashes in self.crash_history.items():
-            recent_crashes = [
-                crash for crash in crashes
-                if datetime.fromisoformat(crash['recorded_at']) > cutoff_time
-            ]
-            summary['recent_crashes'] += len(recent_crashes)
+        self._trim_recent_crash_times(time.time())
+        summary['recent_crashes'] = len(self._recent_crash_times)
 
-        for name, process in self.processes.items():
-            # Count by type
-            if process.config.process_type == ProcessType.NODEJS:
-                if self._is_react_dev_server(process):
-                    summary['by_type']['react_dev'] += 1
-                else:
-                    summary['by_type']['nodejs'] += 1
-            else:
-                summary['by_type']['other'] += 1
+        # Type counts are maintained as processes are added and removed
+        summary['by_type'].update(self._type_counts)
+
+        by_status = summary['by_status']
+        high_resource_usage = summary['high_resource_usage']
+        get_process_metrics = self.get_process_metrics
 
+        for name, process in processes.items():
             # Count by status
-            summary['by_status'][process.status.value] += 1
+            by_status[process.status.value] += 1
+
+            # Processes without a pid always report zero usage
+            if not process.pid:
+                continue
 
             # Check for high resource usage
-            metrics = self.get_process_metrics(name)
+            metrics = get_process_metrics(name)
             if metrics and (metrics.cpu_percent > 80 or metrics.memory_percent > 80):
-                summary['high_resource_usage'].append({
+                high_resource_usage.append({
                     'name': name,
                     'cpu_percent': metrics.cpu_percent,
                     'memory_percent': metrics.memory_percent
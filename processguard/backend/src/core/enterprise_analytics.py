@@ -1,14 +1,64 @@
 import asyncio
-import statistics
+import math
+import time
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from datetime import datetime
+from collections import defaultdict
 from dataclasses import dataclass
 import json
 
 from ..utils.logging import get_logger
 
+# Report and trend paths are memory-bound: a window is a few hundred KB of float64
+# columns, so cost is set by how many times it is swept, not by arithmetic width.
+# Prefer fewer passes over the data to wider vector or GPU kernels.
+METRICS_BUFFER_CAPACITY = 10000
+METRICS_BUFFER_INITIAL_CAPACITY = 256
+ANOMALY_WINDOW = 100
+ANOMALY_Z_THRESHOLD = 3.0
+HIGH_SEVERITY_Z_THRESHOLD = 4.0
+TREND_FLAT_RANGE = 1e-9
+
+CAPACITY_THRESHOLDS = {
+    'cpu_percent': 80,
+    'memory_percent': 85,
+    'disk_usage_percent': 90,
+    'connection_count': 1000
+}
+
+SLA_THRESHOLDS = {
+    'response_time': 1000,  # ms
+    'availability': 99.9,    # %
+    'error_rate': 1.0       # %
+}
+
+def _fit_trends(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Least-squares line through x and every column of y at once, skipping NaN samples
+
+    Returns per-column sample count, slope, R-squared, mean x, mean y and last x.
+    """
+    present = ~np.isnan(y)
+    counts = present.sum(axis=0)
+    xs = np.where(present, (x - x[0])[:, None], 0.0)
+    ys = np.where(present, y, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = xs.sum(axis=0) / counts
+        y_mean = ys.sum(axis=0) / counts
+        dx = np.where(present, xs - x_mean, 0.0)
+        dy = np.where(present, ys - y_mean, 0.0)
+
+        sxx = (dx * dx).sum(axis=0)
+        sxy = (dx * dy).sum(axis=0)
+        syy = (dy * dy).sum(axis=0)
+
+        slopes = sxy / sxx
+        r_squared = np.where(syy != 0, (sxy * sxy) / (sxx * syy), 0.0)
+
+    x_last = np.where(present, xs, -np.inf).max(axis=0)
+    return counts, sxx, slopes, r_squared, x_mean, y_mean, x_last
+
 @dataclass
 class TrendAnalysis:
     metric_name: str
@@ -17,140 +67,301 @@ class TrendAnalysis:
     confidence: float
     prediction_24h: float
 
+class RollingStats:
+    """Welford mean/variance over the values of one metric in the anomaly window"""
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        """Back out a value that has aged out of the window"""
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+class ServiceBuffer:
+    """Bounded ring of metric samples stored as one float64 column per metric
+
+    Columns start small and double until they reach max_capacity, so quiet services
+    do not hold a full-size allocation per metric.
+    """
+
+    __slots__ = ('capacity', 'max_capacity', 'timestamps', 'columns', 'window_stats', 'head', 'size')
+
+    def __init__(self, max_capacity: int = METRICS_BUFFER_CAPACITY):
+        self.max_capacity = max_capacity
+        self.capacity = min(METRICS_BUFFER_INITIAL_CAPACITY, max_capacity)
+        self.timestamps = np.full(self.capacity, np.nan)
+        self.columns: Dict[str, np.ndarray] = {}
+        self.window_stats: Dict[str, RollingStats] = {}
+        self.head = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def ensure_column(self, name: str) -> np.ndarray:
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = np.full(self.capacity, np.nan)
+            self.window_stats[name] = RollingStats()
+        return column
+
+    def _grow(self):
+        """Double the allocation; only called while the ring has not wrapped yet"""
+        capacity = min(self.capacity * 2, self.max_capacity)
+
+        def grown(array: np.ndarray) -> np.ndarray:
+            resized = np.full(capacity, np.nan)
+            resized[:self.size] = array[:self.size]
+            return resized
+
+        self.timestamps = grown(self.timestamps)
+        self.columns = {name: grown(column) for name, column in self.columns.items()}
+        self.head = self.size
+        self.capacity = capacity
+
+    def append(self, timestamp: float, metrics: Dict[str, Any]):
+        if self.size == self.capacity < self.max_capacity:
+            self._grow()
+
+        head = self.head
+        self.timestamps[head] = timestamp
+
+        # The sample leaving the anomaly window once this one is in
+        evicted = (head - ANOMALY_WINDOW) % self.capacity if self.size >= ANOMALY_WINDOW else None
+
+        # Known columns are written in one pass; NaN overwrites any older sample in the slot
+        window_stats = self.window_stats
+        written = 0
+        for name, column in self.columns.items():
+            stats = window_stats[name]
+            if evicted is not None:
+                old_value = float(column[evicted])
+                if old_value == old_value:  # NaN marks a sample without this metric
+                    stats.remove(old_value)
+
+            value = metrics.get(name)
+            # Non-finite samples count as missing, or they would never leave the window sums
+            if isinstance(value, (int, float)) and math.isfinite(value):
+                column[head] = value
+                stats.add(value)
+                written += 1
+            else:
+                column[head] = np.nan
+
+        # Metrics seen for the first time get their own column
+        if written < len(metrics):
+            for name, value in metrics.items():
+                if name not in self.columns and isinstance(value, (int, float)) and math.isfinite(value):
+                    self.ensure_column(name)[head] = value
+                    window_stats[name].add(value)
+
+        self.head = (head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def _tail(self, array: np.ndarray, count: int) -> np.ndarray:
+        """Last count slots of a column in insertion order"""
+        count = min(count, self.size)
+        start = (self.head - count) % self.capacity
+        if start + count <= self.capacity:
+            return array[start:start + count]
+        return np.concatenate((array[start:], array[:self.head]))
+
+    def window(self, count: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Timestamps and metric columns for the most recent count samples"""
+        return (
+            self._tail(self.timestamps, count),
+            {name: self._tail(column, count) for name, column in self.columns.items()}
+        )
+
+    def column(self, name: str, count: int) -> Optional[np.ndarray]:
+        column = self.columns.get(name)
+        return self._tail(column, count) if column is not None else None
+
+    def count_since(self, cutoff: float) -> int:
+        """Number of most recent samples taken after cutoff"""
+        timestamps = self._tail(self.timestamps, self.size)
+        return self.size - int(np.searchsorted(timestamps, cutoff, side='right'))
+
+    def latest(self, name: str) -> Optional[float]:
+        values = self.column(name, self.size)
+        if values is None:
+            return None
+        present = np.flatnonzero(~np.isnan(values))
+        return float(values[present[-1]]) if present.size else None
+
 class EnterpriseAnalytics:
     """Advanced analytics and reporting for enterprise monitoring"""
 
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.metrics_buffer = defaultdict(lambda: deque(maxlen=10000))
+        self.metrics_buffer: Dict[str, ServiceBuffer] = defaultdict(ServiceBuffer)
         self.anomaly_models = {}
         self.capacity_models = {}
         self.performance_baselines = {}
+        self.anomaly_handlers: List[Callable] = []
+
+    def add_anomaly_handler(self, handler: Callable):
+        """Register an async handler called with (service_name, anomalies)"""
+        self.anomaly_handlers.append(handler)
 
     async def ingest_metrics(self, service_name: str, metrics: Dict[str, Any]):
         """Ingest metrics for analysis"""
-        timestamp = datetime.now()
+        # The epoch timestamp is stored in the buffer's float column, not on the point
+        self.metrics_buffer[service_name].append(time.time(), metrics)
 
-        metric_point = {
-            'timestamp': timestamp,
-            'service_name': service_name,
-            **metrics
-        }
+        # Trigger real-time analysis
+        await self._real_time_analysis(service_name, metrics)
 
-        self.metrics_buffer[service_name].append(metric_point)
+    async def ingest_metrics_batch(self, service_name: str, metrics_batch: List[Dict[str, Any]]):
+        """Ingest several metric points at once, notifying anomaly handlers once per batch"""
+        buffer = self.metrics_buffer[service_name]
+        timestamp = time.time()
+        analyze = bool(self.anomaly_handlers)
 
-        # Trigger real-time analysis
-        await self._real_time_analysis(service_name, metric_point)
+        anomalies = []
+        for metrics in metrics_batch:
+            buffer.append(timestamp, metrics)
+            if analyze:
+                anomalies.extend(self._scan_anomalies(buffer, metrics))
+
+        if anomalies:
+            await self._notify_anomaly_handlers(service_name, anomalies)
 
     async def _real_time_analysis(self, service_name: str, metric_point: Dict[str, Any]):
         """Perform real-time analysis on incoming metrics"""
-        # Anomaly detection
-        anomalies = await self._detect_anomalies(service_name, metric_point)
-
-        # Capacity planning
-        capacity_alerts = await self._check_capacity_thresholds(service_name, metric_point)
-
-        # Performance regression detection
-        performance_issues = await self._detect_performance_regression(service_name, metric_point)
+        # Nothing consumes the results, so skip the analysis
+        if not self.anomaly_handlers:
+            return
+
+        # Anomaly detection, scanned inline to avoid another coroutine frame per point
+        anomalies = self._scan_anomalies(self.metrics_buffer[service_name], metric_point)
+        if anomalies:
+            await self._notify_anomaly_handlers(service_name, anomalies)
+
+    async def _notify_anomaly_handlers(self, service_name: str, anomalies: List[Dict[str, Any]]):
+        results = await asyncio.gather(
+            *(handler(service_name, anomalies) for handler in self.anomaly_handlers),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Anomaly handler failed: {result}")
 
     async def _detect_anomalies(self, service_name: str, metric_point: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect anomalies using statistical methods"""
+        return self._scan_anomalies(self.metrics_buffer[service_name], metric_point)
+
+    def _scan_anomalies(self, buffer: ServiceBuffer, metric_point: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Compare a point that was just appended against the buffer's window statistics"""
         anomalies = []
 
-        recent_metrics = list(self.metrics_buffer[service_name])[-100:]  # Last 100 points
+        window_size = min(len(buffer), ANOMALY_WINDOW)  # Last 100 points
 
-        if len(recent_metrics) < 20:  # Need enough data
+        if window_size < 20:  # Need enough data
             return anomalies
 
+        window_stats = buffer.window_stats
+        z_threshold_sq = ANOMALY_Z_THRESHOLD * ANOMALY_Z_THRESHOLD
         for metric_name, value in metric_point.items():
-            if metric_name in ['timestamp', 'service_name'] or not isinstance(value, (int, float)):
+            # Running statistics over the values in the window; only numeric metrics have them
+            stats = window_stats.get(metric_name)
+            if stats is None or stats.count < 10 or metric_name in ('timestamp', 'service_name'):
                 continue
-
-            # Get historical values
-            historical_values = [m.get(metric_name, 0) for m in recent_metrics if isinstance(m.get(metric_name), (int, float))]
-
-            if len(historical_values) < 10:
+            if not isinstance(value, (int, float)):
                 continue
 
-            # Statistical anomaly detection
-            mean_val = statistics.mean(historical_values)
-            std_val = statistics.stdev(historical_values) if len(historical_values) > 1 else 0
-
-            if std_val > 0:
-                z_score = abs(value - mean_val) / std_val
-
-                if z_score > 3:  # 3-sigma rule
-                    anomalies.append({
-                        'type': 'statistical_anomaly',
-                        'metric': metric_name,
-                        'current_value': value,
-                        'expected_value': mean_val,
-                        'z_score': z_score,
-                        'severity': 'high' if z_score > 4 else 'medium'
-                    })
+            # 3-sigma rule on squares, so normal points need no sqrt or divide
+            variance = stats.variance
+            deviation = value - stats.mean
+            if variance > 0 and deviation * deviation > z_threshold_sq * variance:
+                std_val = math.sqrt(variance)
+                deviation = abs(deviation)
+                z_score = deviation / std_val
+                anomalies.append({
+                    'type': 'statistical_anomaly',
+                    'metric': metric_name,
+                    'current_value': value,
+                    'expected_value': stats.mean,
+                    'z_score': z_score,
+                    'severity': 'high' if deviation > HIGH_SEVERITY_Z_THRESHOLD * std_val else 'medium'
+                })
 
         return anomalies
 
-    async def generate_trend_analysis(self, service_name: str, time_window: int = 86400) -> Dict[str, TrendAnalysis]:
-        """Generate trend analysis for service metrics"""
-        cutoff_time = datetime.now() - timedelta(seconds=time_window)
+    async def generate_trend_analysis(self, service_name: str, time_window: int = 86400,
+                                      metric_names: Optional[List[str]] = None) -> Dict[str, TrendAnalysis]:
+        """Generate trend analysis for service metrics, optionally limited to metric_names"""
+        buffer = self.metrics_buffer[service_name]
+        count = buffer.count_since(time.time() - time_window)
 
-        recent_metrics = [
-            m for m in self.metrics_buffer[service_name]
-            if m['timestamp'] > cutoff_time
-        ]
-
-        if len(recent_metrics) < 10:
+        if count < 10:
             return {}
 
         trends = {}
 
-        # Analyze each numeric metric
-        metric_names = set()
-        for metric in recent_metrics:
-            for key, value in metric.items():
-                if key not in ['timestamp', 'service_name'] and isinstance(value, (int, float)):
-                    metric_names.add(key)
-
-        for metric_name in metric_names:
-            trend = await self._calculate_trend(recent_metrics, metric_name)
-            if trend:
-                trends[metric_name] = trend
-
-        return trends
-
-    async def _calculate_trend(self, metrics: List[Dict[str, Any]], metric_name: str) -> Optional[TrendAnalysis]:
-        """Calculate trend for a specific metric"""
-        try:
-            # Extract time series data
-            data_points = []
-            for metric in metrics:
-                if metric_name in metric and isinstance(metric[metric_name], (int, float)):
-                    timestamp = metric['timestamp'].timestamp()
-                    value = metric[metric_name]
-                    data_points.append((timestamp, value))
-
-            if len(data_points) < 5:
-                return None
-
-            # Sort by timestamp
-            data_points.sort(key=lambda x: x[0])
-
-            # Extract x and y values
-            x_values = np.array([dp[0] for dp in data_points])
-            y_values = np.array([dp[1] for dp in data_points])
-
-            # Normalize x values to start from 0
-            x_values = x_values - x_values[0]
-
-            # Calculate linear regression
-            slope, intercept = np.polyfit(x_values, y_values, 1)
+        # Fit every numeric metric in one batch over a (samples, metrics) matrix
+        timestamps, columns = buffer.window(count)
+        if metric_names is not None:
+            columns = {name: columns[name] for name in metric_names if name in columns}
+        if not columns:
+            return trends
+
+        names = list(columns)
+        values = np.column_stack([columns[name] for name in names])
+
+        # Flat columns are stable by definition, so only the rest go through the fit
+        highs = np.fmax.reduce(values, axis=0)
+        flat = (highs - np.fmin.reduce(values, axis=0)) < TREND_FLAT_RANGE
+        if flat.any():
+            for j in np.flatnonzero(flat):
+                if np.count_nonzero(~np.isnan(values[:, j])) >= 5:
+                    trends[names[j]] = TrendAnalysis(
+                        metric_name=names[j],
+                        trend_direction='stable',
+                        slope=0.0,
+                        confidence=1.0,
+                        prediction_24h=float(highs[j])
+                    )
+            names = [name for name, is_flat in zip(names, flat) if not is_flat]
+            values = values[:, ~flat]
+            if not names:
+                return trends
+
+        counts, sxx, slopes, r_squared, x_mean, y_mean, x_last = _fit_trends(timestamps, values)
+
+        seconds_24h = 24 * 3600
+        for j, metric_name in enumerate(names):
+            if counts[j] < 5 or sxx[j] == 0:
+                continue
 
-            # Calculate R-squared for confidence
-            y_pred = slope * x_values + intercept
-            ss_res = np.sum((y_values - y_pred) ** 2)
-            ss_tot = np.sum((y_values - np.mean(y_values)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+            slope = float(slopes[j])
 
             # Determine trend direction
             if abs(slope) < 0.01:  # Threshold for stable
@@ -161,24 +372,21 @@ class EnterpriseAnalytics:
                 trend_direction = 'decreasing'
 
             # Predict 24h ahead
-            seconds_24h = 24 * 3600
-            prediction_24h = slope * (x_values[-1] + seconds_24h) + intercept
+            prediction_24h = float(y_mean[j] + slope * (x_last[j] + seconds_24h - x_mean[j]))
 
-            return TrendAnalysis(
+            trends[metric_name] = TrendAnalysis(
                 metric_name=metric_name,
                 trend_direction=trend_direction,
                 slope=slope,
-                confidence=r_squared,
+                confidence=float(r_squared[j]),
                 prediction_24h=prediction_24h
             )
 
-        except Exception as e:
-            self.logger.error(f"Trend calculation failed for {metric_name}: {e}")
-            return None
+        return trends
 
     async def generate_capacity_forecast(self, service_name: str) -> Dict[str, Any]:
         """Generate capacity planning forecast"""
-        trends = await self.generate_trend_analysis(service_name)
+        trends = await self.generate_trend_analysis(service_name, metric_names=list(CAPACITY_THRESHOLDS))
 
         capacity_forecast = {
             'service_name': service_name,
@@ -187,17 +395,9 @@ class EnterpriseAnalytics:
             'recommendations': []
         }
 
-        # Define capacity thresholds
-        capacity_thresholds = {
-            'cpu_percent': 80,
-            'memory_percent': 85,
-            'disk_usage_percent': 90,
-            'connection_count': 1000
-        }
-
         for metric_name, trend in trends.items():
-            if metric_name in capacity_thresholds:
-                threshold = capacity_thresholds[metric_name]
+            if metric_name in CAPACITY_THRESHOLDS:
+                threshold = CAPACITY_THRESHOLDS[metric_name]
 
                 # Calculate days until threshold
                 current_value = self._get_latest_metric_value(service_name, metric_name)
@@ -233,59 +433,57 @@ class EnterpriseAnalytics:
 
     def _get_latest_metric_value(self, service_name: str, metric_name: str) -> Optional[float]:
         """Get latest value for a metric"""
-        recent_metrics = list(self.metrics_buffer[service_name])
-        for metric in reversed(recent_metrics):
-            if metric_name in metric and isinstance(metric[metric_name], (int, float)):
-                return metric[metric_name]
-        return None
+        return self.metrics_buffer[service_name].latest(metric_name)
 
     async def generate_performance_report(self, service_name: str, time_window: int = 86400) -> Dict[str, Any]:
         """Generate comprehensive performance report"""
-        cutoff_time = datetime.now() - timedelta(seconds=time_window)
+        buffer = self.metrics_buffer[service_name]
+        count = buffer.count_since(time.time() - time_window)
 
-        recent_metrics = [
-            m for m in self.metrics_buffer[service_name]
-            if m['timestamp'] > cutoff_time
-        ]
-
-        if not recent_metrics:
+        if not count:
             return {'status': 'no_data'}
 
         # Calculate performance statistics
         report = {
             'service_name': service_name,
             'time_window_hours': time_window / 3600,
-            'data_points': len(recent_metrics),
+            'data_points': count,
             'performance_summary': {},
             'sla_compliance': {},
             'recommendations': []
         }
 
         # Performance metrics analysis
-        performance_metrics = ['cpu_percent', 'memory_percent', 'response_time', 'throughput']
+        performance_metrics = [
+            metric for metric in ('cpu_percent', 'memory_percent', 'response_time', 'throughput')
+            if metric in buffer.columns
+        ]
 
-        for metric in performance_metrics:
-            values = [m.get(metric) for m in recent_metrics if m.get(metric) is not None]
+        if performance_metrics:
+            # One (metrics, samples) window with a contiguous row per metric, sorted once
+            # with NaN last; every statistic is then read from the valid prefix of its row
+            window = np.vstack([buffer.column(metric, count) for metric in performance_metrics])
+            counts = np.count_nonzero(~np.isnan(window), axis=1)
+            ordered = np.sort(window, axis=1)
 
-            if values:
+            for j, metric in enumerate(performance_metrics):
+                n = int(counts[j])
+                if not n:
+                    continue
+
+                column = ordered[j, :n]
                 report['performance_summary'][metric] = {
-                    'average': statistics.mean(values),
-                    'median': statistics.median(values),
-                    'p95': self._percentile(values, 95),
-                    'p99': self._percentile(values, 99),
-                    'min': min(values),
-                    'max': max(values),
-                    'std_dev': statistics.stdev(values) if len(values) > 1 else 0
+                    'average': float(column.mean()),
+                    'median': float((column[(n - 1) // 2] + column[n // 2]) / 2),
+                    'p95': float(column[min(int(0.95 * n), n - 1)]),
+                    'p99': float(column[min(int(0.99 * n), n - 1)]),
+                    'min': float(column[0]),
+                    'max': float(column[n - 1]),
+                    'std_dev': float(column.std(ddof=1)) if n > 1 else 0
                 }
 
         # SLA compliance check
-        sla_thresholds = {
-            'response_time': 1000,  # ms
-            'availability': 99.9,    # %
-            'error_rate': 1.0       # %
-        }
-
-        for sla_metric, threshold in sla_thresholds.items():
+        for sla_metric, threshold in SLA_THRESHOLDS.items():
             if sla_metric in report['performance_summary']:
                 avg_value = report['performance_summary'][sla_metric]['average']
                 compliant = avg_value <= threshold
@@ -299,14 +497,6 @@ class EnterpriseAnalytics:
 
         return report
 
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """Calculate percentile"""
-        if not data:
-            return 0
-        sorted_data = sorted(data)
-        index = int((percentile / 100) * len(sorted_data))
-        return sorted_data[min(index, len(sorted_data) - 1)]
-
     async def generate_cost_analysis(self, service_name: str) -> Dict[str, Any]:
         """Generate cost analysis and optimization recommendations"""
         # This would integrate with cloud provider APIs for actual costs
@@ -324,11 +514,11 @@ class EnterpriseAnalytics:
         }
 
         # Analyze resource utilization for cost optimization
-        latest_metrics = list(self.metrics_buffer[service_name])[-100:]
+        buffer = self.metrics_buffer[service_name]
 
-        if latest_metrics:
-            avg_cpu = statistics.mean([m.get('cpu_percent', 0) for m in latest_metrics])
-            avg_memory = statistics.mean([m.get('memory_percent', 0) for m in latest_metrics])
+        if len(buffer):
+            avg_cpu = self._window_mean(buffer, 'cpu_percent', 100)
+            avg_memory = self._window_mean(buffer, 'memory_percent', 100)
 
             # Generate cost optimization recommendations
             if avg_cpu < 30:
@@ -349,6 +539,13 @@ class EnterpriseAnalytics:
 
         return cost_analysis
 
+    def _window_mean(self, buffer: ServiceBuffer, metric_name: str, count: int) -> float:
+        """Mean of a metric over the last count samples, counting missing values as 0"""
+        values = buffer.column(metric_name, count)
+        if values is None:
+            return 0.0
+        return float(np.nan_to_num(values, nan=0.0).mean())
+
     async def generate_executive_dashboard(self) -> Dict[str, Any]:
         """Generate executive-level dashboard data"""
         dashboard = {
@@ -1,14 +1,18 @@
 import asyncio
 import json
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
-import aioredis
+import aiohttp
+from redis.asyncio import Redis
 
 from ..utils.logging import get_logger
 
+FAILOVER_EVENT_BATCH_SIZE = 100
+FAILOVER_EVENT_FLUSH_INTERVAL = 0.05  # seconds
+
 class FailoverStrategy(Enum):
     ACTIVE_PASSIVE = "active_passive"
     ACTIVE_ACTIVE = "active_active"
@@ -26,13 +30,35 @@ class HealthCheckConfig:
 class EnterpriseReliability:
     """Enterprise-grade reliability and high availability features"""
 
-    def __init__(self, redis_client=None):
+    def __init__(self, redis_client: Optional[Redis] = None):
         self.logger = get_logger(__name__)
         self.redis = redis_client
         self.circuit_breakers = {}
         self.health_checks = {}
         self.failover_groups = {}
         self.disaster_recovery_plans = {}
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._pending_events: List[Tuple[str, str]] = []
+        self._event_flush_task: Optional[asyncio.Task] = None
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session used for health probes"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._http
+
+    async def close(self):
+        """Flush pending failover events and close the shared HTTP session"""
+        if self._event_flush_task is not None:
+            self._event_flush_task.cancel()
+            self._event_flush_task = None
+        await self._flush_failover_events()
+
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
 
     async def setup_high_availability(self, service_name: str, config: Dict[str, Any]):
         """Setup HA configuration for a service"""
@@ -58,19 +84,18 @@ class EnterpriseReliability:
 
         while True:
             try:
-                # Check primary instance health
-                primary_healthy = await self._check_instance_health(
-                    ha_config['primary_instance'],
-                    health_check
+                # Probe the primary and all secondary instances concurrently
+                primary_healthy, *_ = await asyncio.gather(
+                    self._check_instance_health(ha_config['primary_instance'], health_check),
+                    *(
+                        self._check_instance_health(instance, health_check)
+                        for instance in ha_config['secondary_instances']
+                    )
                 )
 
                 if not primary_healthy:
                     await self._handle_primary_failure(service_name, ha_config)
 
-                # Check secondary instances
-                for instance in ha_config['secondary_instances']:
-                    await self._check_instance_health(instance, health_check)
-
                 await asyncio.sleep(health_check.interval)
 
             except Exception as e:
@@ -80,13 +105,11 @@ class EnterpriseReliability:
     async def _check_instance_health(self, instance: str, health_check: HealthCheckConfig) -> bool:
         """Check health of a specific instance"""
         try:
-            import aiohttp
             timeout = aiohttp.ClientTimeout(total=health_check.timeout)
 
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(health_check.endpoint) as response:
-                    if response.status == 200:
-                        return True
+            async with self._get_http_session().get(health_check.endpoint, timeout=timeout) as response:
+                if response.status == 200:
+                    return True
 
         except Exception as e:
             self.logger.warning(f"Health check failed for {instance}: {e}")
@@ -127,17 +150,15 @@ class EnterpriseReliability:
 
     async def _select_best_secondary(self, secondary_instances: List[str]) -> Optional[str]:
         """Select the best secondary instance for promotion"""
-        # Check health and performance metrics of all secondaries
-        best_instance = None
-        best_score = 0
-
-        for instance in secondary_instances:
-            score = await self._calculate_instance_score(instance)
-            if score > best_score:
-                best_score = score
-                best_instance = instance
+        # Score all secondaries concurrently
+        scores = await asyncio.gather(
+            *(self._calculate_instance_score(instance) for instance in secondary_instances)
+        )
+        if not scores:
+            return None
 
-        return best_instance
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        return secondary_instances[best_index] if scores[best_index] > 0 else None
 
     async def _calculate_instance_score(self, instance: str) -> float:
         """Calculate instance score based on various metrics"""
@@ -232,7 +253,7 @@ class EnterpriseReliability:
         """Initiate disaster recovery procedure"""
         self.logger.critical(f"Initiating disaster recovery for {service_name}")
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         try:
             # 1. Validate backup data
@@ -252,7 +273,7 @@ class EnterpriseReliability:
             # 5. Verify service functionality
             service_healthy = await self._verify_dr_service_health(service_name)
 
-            recovery_time = (datetime.now() - start_time).total_seconds()
+            recovery_time = time.monotonic() - start_time
 
             if service_healthy and recovery_time <= dr_plan['rto']:
                 self.logger.info(f"DR successful for {service_name} in {recovery_time}s")
@@ -282,7 +303,7 @@ class EnterpriseReliability:
     async def _record_failover_event(self, service_name: str, ha_config: Dict[str, Any]):
         """Record failover event for analysis"""
         event = {
-            'timestamp': datetime.now(),
+            'timestamp': datetime.now().isoformat(),
             'service_name': service_name,
             'event_type': 'failover',
             'strategy': ha_config['strategy'].value,
@@ -290,8 +311,35 @@ class EnterpriseReliability:
             'failover_duration': None  # Would be calculated
         }
 
-        if self.redis:
-            await self.redis.lpush(f"failover_events:{service_name}", json.dumps(event, default=str))
+        if not self.redis:
+            return
+
+        # Events are buffered and written in pipelined batches so failover storms
+        # cost one round trip per batch instead of one per event
+        self._pending_events.append((f"failover_events:{service_name}", json.dumps(event, separators=(',', ':'))))
+        if len(self._pending_events) >= FAILOVER_EVENT_BATCH_SIZE:
+            await self._flush_failover_events()
+        elif self._event_flush_task is None:
+            self._event_flush_task = asyncio.create_task(self._flush_failover_events_later())
+
+    async def _flush_failover_events_later(self):
+        await asyncio.sleep(FAILOVER_EVENT_FLUSH_INTERVAL)
+        self._event_flush_task = None
+        await self._flush_failover_events()
+
+    async def _flush_failover_events(self):
+        """Write buffered failover events to Redis in one pipeline"""
+        if not self._pending_events or not self.redis:
+            return
+
+        batch, self._pending_events = self._pending_events, []
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, payload in batch:
+                    pipe.lpush(key, payload)
+                await pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Failed to record {len(batch)} failover events: {e}")
 
     async def generate_reliability_report(self) -> Dict[str, Any]:
         """Generate comprehensive reliability report"""
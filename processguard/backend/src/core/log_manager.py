@@ -1,15 +1,76 @@
 import os
+import gzip
+import time
+import shutil
 import asyncio
-import aiofiles
 from pathlib import Path
-from typing import Dict, List, Optional, AsyncGenerator
+from typing import BinaryIO, Dict, List, Optional, AsyncGenerator, Set, Tuple
 from datetime import datetime, timedelta
 from collections import deque
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils.logging import get_logger
 
+LOG_WRITE_BATCH_SIZE = 256
+LOG_WRITE_BATCH_BYTES = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.5  # seconds
+LOG_FSYNC_INTERVAL = 5.0  # seconds
+LOG_STREAM_POLL_MIN = 0.1  # seconds
+LOG_STREAM_POLL_MAX = 1.0  # seconds
+LOG_FILE_SUFFIXES = ('.log', '.log.gz')
+
+# Encoded text between a line's timestamp and its message, per common level
+_LEVEL_TOKENS = {
+    level: f"] [{level}] ".encode('ascii') for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+}
+
+# Queued to stop the writer thread
+_WRITER_STOP = object()
+
+def _tail_offset(f: BinaryIO, lines: int, block_size: int = 8192) -> int:
+    """Offset where the last lines of an open binary file start, found reading backwards"""
+    end = f.seek(0, os.SEEK_END)
+    if lines <= 0:
+        return end
+
+    # A trailing newline terminates the last line rather than starting a new one
+    position = end
+    if end:
+        f.seek(end - 1)
+        if f.read(1) == b'\n':
+            position -= 1
+
+    remaining = lines
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        f.seek(position)
+        block = f.read(read_size)
+
+        index = len(block)
+        while True:
+            index = block.rfind(b'\n', 0, index)
+            if index < 0:
+                break
+            remaining -= 1
+            if not remaining:
+                return position + index + 1
+
+    return 0
+
+def read_tail_lines(file_path: str, lines: int) -> List[str]:
+    """Read the last lines of a file without reading the rest of it"""
+    if lines <= 0:
+        return []
+
+    with open(file_path, 'rb') as f:
+        f.seek(_tail_offset(f, lines))
+        data = f.read()
+
+    return [line.decode('utf-8', errors='replace') for line in data.splitlines()[-lines:]]
+
 class LogManager:
     def __init__(self, log_base_dir: str = "/var/log/processguard"):
         self.log_base_dir = Path(log_base_dir)
@@ -18,11 +79,27 @@ class LogManager:
 
         self._log_buffers: Dict[str, deque] = {}
         self._log_files: Dict[str, str] = {}
-        self._log_locks: Dict[str, threading.Lock] = {}
+
+        # Open append handles and their byte counts; only touched under _handles_lock
+        self._log_handles: Dict[str, BinaryIO] = {}
+        self._log_sizes: Dict[str, int] = {}
+        self._handles_lock = threading.RLock()
+
+        # Streams waiting on new lines, as (event loop, wakeup event) per process
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
 
         self._max_buffer_size = 1000
+        self._timestamp_prefix = (0, '')
         self._log_rotation_size = 10 * 1024 * 1024
 
+        # Producers enqueue (process_name, message); one writer thread does all file I/O
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer_thread.start()
+
+        # Rotated logs are gzipped here so the writer thread never waits on compression
+        self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
     def create_log_file(self, process_name: str) -> str:
         log_dir = self.log_base_dir / process_name
         log_dir.mkdir(exist_ok=True)
@@ -30,39 +107,190 @@ class LogManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"{process_name}_{timestamp}.log"
 
-        self._log_files[process_name] = str(log_file)
-        self._log_buffers[process_name] = deque(maxlen=self._max_buffer_size)
-        self._log_locks[process_name] = threading.Lock()
+        with self._handles_lock:
+            self._close_handle(process_name)
 
-        return str(log_file)
-
-    def write_log(self, process_name: str, message: str, level: str = "INFO"):
-        if process_name not in self._log_buffers:
-            self.create_log_file(process_name)
+            handle = open(log_file, 'ab', buffering=0)
+            self._log_handles[process_name] = handle
+            self._log_sizes[process_name] = handle.tell()
 
-        timestamp = datetime.now().isoformat()
-        formatted_message = f"[{timestamp}] [{level}] {message}"
+            self._log_files[process_name] = str(log_file)
+            self._log_buffers.setdefault(process_name, deque(maxlen=self._max_buffer_size))
 
-        with self._log_locks[process_name]:
-            self._log_buffers[process_name].append(formatted_message)
+        return str(log_file)
 
-        if process_name in self._log_files:
-            self._write_to_file(process_name, formatted_message)
+    def _close_handle(self, process_name: str):
+        handle = self._log_handles.pop(process_name, None)
+        self._log_sizes.pop(process_name, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError as e:
+                self.logger.error(f"Failed to close log for {process_name}: {e}")
 
-    def _write_to_file(self, process_name: str, message: str):
+    def write_log(self, process_name: str, message: str, level: str = "INFO"):
+        if process_name not in self._log_buffers:
+            # Checked again under the lock so racing first writes open a single file
+            with self._handles_lock:
+                if process_name not in self._log_buffers:
+                    self.create_log_file(process_name)
+
+        # Lines stay unformatted until read back or written out by the writer thread
+        entry = (self._timestamp(), level, message)
+
+        # Both are atomic under the GIL, so producers never take a lock
+        self._log_buffers[process_name].append(entry)
+        self._write_queue.put_nowait((process_name, entry))
+
+    def _timestamp(self) -> str:
+        """Local ISO timestamp with microseconds, reformatting the date part once per second"""
+        now = time.time()
+        second = int(now)
+        cached_second, prefix = self._timestamp_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+            # One tuple, so concurrent producers never pair a second with another's prefix
+            self._timestamp_prefix = (second, prefix)
+        return f"{prefix}.{int((now - second) * 1e6):06d}"
+
+    def _writer_loop(self):
+        write_queue = self._write_queue
+        last_sync = last_fsync = time.monotonic()
+
+        # One reusable byte buffer per process, owned by this thread
+        buffers: Dict[str, bytearray] = {}
+        # Processes written since the last fsync
+        unsynced: Set[str] = set()
+
+        while True:
+            try:
+                item = write_queue.get(timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                item = None
+
+            # Drain what is queued into the per-process buffers
+            batch: Dict[str, bytearray] = {}
+            count = 0
+            size = 0
+            stop = False
+            flushed: Optional[threading.Event] = None
+            while item is not None:
+                if item is _WRITER_STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    # A flush() caller, released once everything queued before it is written
+                    flushed = item
+                    break
+
+                process_name, (timestamp, level, message) = item
+                buffer = batch.get(process_name)
+                if buffer is None:
+                    buffer = batch[process_name] = buffers.setdefault(process_name, bytearray())
+                before = len(buffer)
+                buffer += b'['
+                buffer += timestamp.encode('ascii')
+                buffer += _LEVEL_TOKENS.get(level) or f"] [{level}] ".encode('utf-8')
+                buffer += message.encode('utf-8')
+                buffer += b'\n'
+                count += 1
+                size += len(buffer) - before
+                if count >= LOG_WRITE_BATCH_SIZE or size >= LOG_WRITE_BATCH_BYTES:
+                    break
+
+                try:
+                    item = write_queue.get_nowait()
+                except queue.Empty:
+                    item = None
+
+            with self._handles_lock:
+                for process_name, buffer in batch.items():
+                    self._write_to_file(process_name, buffer)
+                    if process_name in self._log_handles:
+                        buffer.clear()
+                    else:
+                        del buffers[process_name]
+                if self._subscribers:
+                    self._notify_subscribers(batch)
+
+                # The managed process may append to the same file directly
+                now = time.monotonic()
+                if now - last_sync >= LOG_FLUSH_INTERVAL:
+                    self._sync_log_sizes()
+                    last_sync = now
+
+                # Durability is grouped: one fsync per written file per interval, not per batch
+                unsynced.update(batch)
+                if unsynced and (stop or now - last_fsync >= LOG_FSYNC_INTERVAL):
+                    self._fsync_logs(unsynced)
+                    unsynced.clear()
+                    last_fsync = now
+
+            if flushed is not None:
+                flushed.set()
+            if stop:
+                return
+
+    def _write_to_file(self, process_name: str, data: bytearray):
+        """Append a batch of encoded lines; called by the writer thread with _handles_lock held"""
         try:
-            log_file = self._log_files[process_name]
+            if process_name not in self._log_handles:
+                return
 
-            if os.path.exists(log_file) and os.path.getsize(log_file) > self._log_rotation_size:
+            # Rotate on the tracked size before this batch would push the file over the limit
+            size = self._log_sizes[process_name]
+            if size and size + len(data) > self._log_rotation_size:
                 self._rotate_log(process_name)
 
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(message + '\n')
-                f.flush()
+            fd = self._log_handles[process_name].fileno()
+            written = os.write(fd, data)
+            while written < len(data):
+                # Short writes are rare; only then is the remainder copied
+                written += os.write(fd, data[written:])
+
+            self._log_sizes[process_name] += len(data)
 
         except Exception as e:
             self.logger.error(f"Failed to write log for {process_name}: {e}")
 
+    def _fsync_logs(self, process_names: Set[str]):
+        for process_name in process_names:
+            handle = self._log_handles.get(process_name)
+            if handle is None:
+                continue
+            try:
+                os.fsync(handle.fileno())
+            except OSError as e:
+                self.logger.error(f"Failed to sync log for {process_name}: {e}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every line queued so far has been written to its file"""
+        if not self._writer_thread.is_alive():
+            return True
+
+        flushed = threading.Event()
+        self._write_queue.put_nowait(flushed)
+        return flushed.wait(timeout)
+
+    def _sync_log_sizes(self):
+        for process_name, handle in self._log_handles.items():
+            try:
+                self._log_sizes[process_name] = os.fstat(handle.fileno()).st_size
+            except OSError as e:
+                self.logger.error(f"Failed to stat log for {process_name}: {e}")
+
+    def close(self):
+        """Write out queued lines, stop the writer thread and close all log handles"""
+        if self._writer_thread.is_alive():
+            self._write_queue.put_nowait(_WRITER_STOP)
+            self._writer_thread.join()
+
+        with self._handles_lock:
+            for process_name in list(self._log_handles):
+                self._close_handle(process_name)
+
+        self._compressor.shutdown(wait=True)
+
     def _rotate_log(self, process_name: str):
         try:
             current_log = self._log_files[process_name]
@@ -70,23 +298,49 @@ class LogManager:
 
             log_dir = Path(current_log).parent
             archived_log = log_dir / f"{process_name}_{timestamp}_archived.log"
-
-            os.rename(current_log, archived_log)
-
-            self.create_log_file(process_name)
+            # Several rotations can land in one second; never overwrite an earlier archive
+            suffix = 1
+            while archived_log.exists() or archived_log.with_name(archived_log.name + '.gz').exists():
+                archived_log = log_dir / f"{process_name}_{timestamp}_{suffix}_archived.log"
+                suffix += 1
+
+            # Copy and truncate rather than rename: the managed process holds its own append
+            # descriptor on this path, which keeps pointing at the live log this way
+            with self._handles_lock:
+                shutil.copyfile(current_log, archived_log)
+                os.truncate(current_log, 0)
+                self._log_sizes[process_name] = 0
             self.logger.info(f"Rotated log for {process_name}: {archived_log}")
 
+            self._compressor.submit(self._compress_log, archived_log)
+
         except Exception as e:
             self.logger.error(f"Failed to rotate log for {process_name}: {e}")
 
+    def _compress_log(self, log_file: Path):
+        """Gzip a rotated log next to the original, then remove the original"""
+        compressed = log_file.with_name(log_file.name + '.gz')
+        try:
+            with open(log_file, 'rb') as src, gzip.open(compressed, 'wb') as dst:
+                shutil.copyfileobj(src, dst, LOG_WRITE_BATCH_BYTES)
+            log_file.unlink()
+        except FileNotFoundError:
+            # The process's logs were removed while this was queued
+            compressed.unlink(missing_ok=True)
+        except Exception as e:
+            self.logger.error(f"Failed to compress rotated log {log_file}: {e}")
+            compressed.unlink(missing_ok=True)
+
     def get_recent_logs(self, process_name: str, lines: int = 100) -> List[str]:
         if process_name not in self._log_buffers:
             return []
 
-        with self._log_locks[process_name]:
-            buffer = list(self._log_buffers[process_name])
+        # A list() snapshot of a deque is atomic under the GIL
+        buffer = list(self._log_buffers[process_name])
+        if len(buffer) > lines:
+            buffer = buffer[-lines:]
 
-        return buffer[-lines:] if len(buffer) > lines else buffer
+        return [f"[{timestamp}] [{level}] {message}" for timestamp, level, message in buffer]
 
     async def get_log_stream(self, process_name: str) -> AsyncGenerator[str, None]:
         if process_name not in self._log_files:
@@ -94,81 +348,135 @@ class LogManager:
 
         log_file = self._log_files[process_name]
 
+        wakeup = self.subscribe(process_name)
         try:
-            async with aiofiles.open(log_file, 'r') as f:
-                await f.seek(0, 2)
+            with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
+                f.seek(0, os.SEEK_END)
+                idle_wait = LOG_STREAM_POLL_MIN
 
                 while True:
-                    line = await f.readline()
+                    wakeup.clear()
+                    line = f.readline()
                     if line:
-                        yield line.strip()
-                    else:
-                        await asyncio.sleep(0.1)
+                        idle_wait = LOG_STREAM_POLL_MIN
+                        while line:
+                            yield line.strip()
+                            line = f.readline()
+                        continue
+
+                    # Rotation truncates the file in place; follow it back to the start
+                    if os.fstat(f.fileno()).st_size < f.tell():
+                        f.seek(0)
+                        continue
+
+                    # Lines from write_log wake the stream immediately; output the managed
+                    # process writes to the file itself is picked up by a backing-off poll
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), idle_wait)
+                    except asyncio.TimeoutError:
+                        idle_wait = min(idle_wait * 2, LOG_STREAM_POLL_MAX)
 
         except Exception as e:
             self.logger.error(f"Error streaming logs for {process_name}: {e}")
+        finally:
+            self.unsubscribe(process_name, wakeup)
+
+    def subscribe(self, process_name: str) -> asyncio.Event:
+        """Get an event set from the writer thread whenever lines for process_name are written"""
+        wakeup = asyncio.Event()
+        with self._handles_lock:
+            self._subscribers.setdefault(process_name, []).append((asyncio.get_running_loop(), wakeup))
+        return wakeup
+
+    def unsubscribe(self, process_name: str, wakeup: asyncio.Event):
+        with self._handles_lock:
+            subscribers = self._subscribers.get(process_name, [])
+            subscribers[:] = [entry for entry in subscribers if entry[1] is not wakeup]
+            if not subscribers:
+                self._subscribers.pop(process_name, None)
+
+    def _notify_subscribers(self, process_names):
+        """Wake streams for the given processes; called by the writer thread with _handles_lock held"""
+        for process_name in process_names:
+            for loop, wakeup in self._subscribers.get(process_name, ()):
+                try:
+                    loop.call_soon_threadsafe(wakeup.set)
+                except RuntimeError:
+                    # The subscriber's loop has closed; it unsubscribes on its way out
+                    pass
 
     def get_log_file_path(self, process_name: str) -> Optional[str]:
         return self._log_files.get(process_name)
 
     def cleanup_old_logs(self, days: int = 7):
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        for process_dir in self.log_base_dir.iterdir():
-            if process_dir.is_dir():
-                for log_file in process_dir.glob("*.log"):
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        # A quiet process's current log can be old too, but it is still held open for writing
+        current_logs = set(self._log_files.values())
+
+        with os.scandir(self.log_base_dir) as process_dirs:
+            for process_dir in process_dirs:
+                if not process_dir.is_dir():
+                    continue
+
+                for log_file in self._scan_log_files(process_dir.path):
+                    if log_file.path in current_logs:
+                        continue
                     try:
-                        file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-                        if file_time < cutoff_date:
-                            log_file.unlink()
-                            self.logger.info(f"Cleaned up old log file: {log_file}")
+                        if log_file.stat().st_mtime < cutoff_ts:
+                            os.unlink(log_file.path)
+                            self.logger.info(f"Cleaned up old log file: {log_file.path}")
                     except Exception as e:
-                        self.logger.error(f"Failed to clean up {log_file}: {e}")
+                        self.logger.error(f"Failed to clean up {log_file.path}: {e}")
+
+    @staticmethod
+    def _scan_log_files(log_dir) -> List[os.DirEntry]:
+        """Current, archived and compressed log files in a process log directory"""
+        with os.scandir(log_dir) as entries:
+            return [entry for entry in entries if entry.name.endswith(LOG_FILE_SUFFIXES)]
 
     def list_log_files(self, process_name: str) -> List[Dict[str, str]]:
         log_dir = self.log_base_dir / process_name
         if not log_dir.exists():
             return []
 
+        current_log = self._log_files.get(process_name)
         log_files = []
-        for log_file in log_dir.glob("*.log"):
+        for log_file in self._scan_log_files(log_dir):
             try:
                 stat = log_file.stat()
                 log_files.append({
                     "name": log_file.name,
-                    "path": str(log_file),
+                    "path": log_file.path,
                     "size": stat.st_size,
                     "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "is_current": str(log_file) == self._log_files.get(process_name)
+                    "is_current": log_file.path == current_log
                 })
             except Exception as e:
-                self.logger.error(f"Failed to get info for {log_file}: {e}")
+                self.logger.error(f"Failed to get info for {log_file.path}: {e}")
 
         return sorted(log_files, key=lambda x: x["modified"], reverse=True)
 
     async def tail_log_file(self, file_path: str, lines: int = 50) -> List[str]:
         try:
-            async with aiofiles.open(file_path, 'r') as f:
-                content = await f.read()
-                all_lines = content.splitlines()
-                return all_lines[-lines:] if len(all_lines) > lines else all_lines
+            return await asyncio.get_running_loop().run_in_executor(None, read_tail_lines, file_path, lines)
         except Exception as e:
             self.logger.error(f"Failed to tail log file {file_path}: {e}")
             return []
 
     def remove_process_logs(self, process_name: str):
-        if process_name in self._log_buffers:
-            del self._log_buffers[process_name]
-        if process_name in self._log_files:
-            del self._log_files[process_name]
-        if process_name in self._log_locks:
-            del self._log_locks[process_name]
+        with self._handles_lock:
+            self._close_handle(process_name)
+
+            if process_name in self._log_buffers:
+                del self._log_buffers[process_name]
+            if process_name in self._log_files:
+                del self._log_files[process_name]
 
         log_dir = self.log_base_dir / process_name
         if log_dir.exists():
             try:
-                for log_file in log_dir.glob("*.log"):
-                    log_file.unlink()
+                for log_file in self._scan_log_files(log_dir):
+                    os.unlink(log_file.path)
                 log_dir.rmdir()
                 self.logger.info(f"Removed all logs for process: {process_name}")
             except Exception as e:
@@ -1,8 +1,10 @@
 import json
 import re
+import time
 import requests
 import asyncio
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import psutil
 from pathlib import Path
@@ -10,34 +12,97 @@ from pathlib import Path
 from ..models.process import ProcessMetrics, ManagedProcess
 from ..utils.logging import get_logger
 
+NPM_AUDIT_INTERVAL_SECONDS = 3600
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+PROBE_CONCURRENCY = 8
+METRICS_PORTS = (3000, 8000, 9229, 9230)  # Common Node.js ports
+METRICS_ENDPOINTS = ('/metrics', '/health', '/status', '/_health')
+
+NODEJS_CRASH_PATTERNS = (
+    (r'Error: Cannot find module', 'missing_module'),
+    (r'ReferenceError:', 'reference_error'),
+    (r'TypeError:', 'type_error'),
+    (r'SyntaxError:', 'syntax_error'),
+    (r'EADDRINUSE.*address already in use', 'port_in_use'),
+    (r'ECONNREFUSED', 'connection_refused'),
+    (r'UnhandledPromiseRejectionWarning', 'unhandled_promise'),
+    (r'MaxListenersExceededWarning', 'memory_leak_warning'),
+    (r'FATAL ERROR:.*JavaScript heap out of memory', 'heap_overflow'),
+    (r'segmentation fault', 'segfault'),
+    (r'Error: spawn.*ENOENT', 'spawn_error')
+)
+
+# One alternation rejects clean lines in a single scan; only matching lines are
+# checked against each pattern, since one line can report several crash types
+_CRASH_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in NODEJS_CRASH_PATTERNS), re.IGNORECASE)
+_CRASH_PATTERN_CHECKS = tuple(
+    (pattern, error_type, re.compile(pattern, re.IGNORECASE)) for pattern, error_type in NODEJS_CRASH_PATTERNS
+)
+
+# Name (with any labels) and value of each Prometheus sample line; comments never match
+_PROMETHEUS_SAMPLE = re.compile(rb'^([^#\s]\S*) (\S+)', re.MULTILINE)
+
 class NodeJSMonitor:
     """Enhanced monitoring for Node.js applications"""
 
     def __init__(self):
         self.logger = get_logger(__name__)
-
-    async def get_nodejs_metrics(self, process: ManagedProcess) -> Dict[str, Any]:
-        """Get Node.js specific metrics"""
+        self._package_json_cache: Dict[str, Tuple[int, Dict]] = {}
+
+        # Keep-alive sessions for local HTTP probes, one per executor thread since
+        # requests.Session isn't safe to share between threads
+        self._http_local = threading.local()
+        # Metrics URL that answered last time, per process
+        self._metrics_endpoints: Dict[str, str] = {}
+        self._package_lock_cache: Dict[str, Tuple[int, int]] = {}
+        # working dir -> (audited at, result), and audits currently running
+        self._npm_audit_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._npm_audit_tasks: Dict[str, asyncio.Task] = {}
+
+    async def get_nodejs_metrics(self, process: ManagedProcess,
+                                 connections: Optional[List[Any]] = None) -> Dict[str, Any]:
+        """Get Node.js specific metrics, reusing the process's connections if already read"""
         metrics = {}
 
         if not process.pid:
             return metrics
 
         try:
-            # Basic process metrics
+            # One process handle per poll; oneshot caches the /proc reads the helpers share
             ps_process = psutil.Process(process.pid)
+            with ps_process.oneshot():
+                event_loop_lag = self._get_event_loop_lag(ps_process)
+                active_handles = self._get_active_handles(ps_process)
+                node_version = self._get_node_version(ps_process)
+                environment = self._get_node_environment(ps_process)
+
+                # The socket table is read once for both the socket list and the port probes
+                connections_error = None
+                if connections is None:
+                    try:
+                        connections = ps_process.connections(kind='inet')
+                    except Exception as e:
+                        connections = []
+                        connections_error = e
+
+            # HTTP probes are independent, so run them concurrently
+            heap_usage, port_status = await asyncio.gather(
+                self._get_heap_usage(process),
+                self._check_port_health(connections, connections_error)
+            )
 
             # Node.js specific metrics
             metrics.update({
-                'memory_heap_used': self._get_heap_usage(process),
-                'event_loop_lag': self._get_event_loop_lag(process),
-                'active_handles': self._get_active_handles(process),
-                'open_sockets': self._get_open_sockets(process),
-                'npm_dependencies': self._check_npm_dependencies(process),
+                'memory_heap_used': heap_usage,
+                'event_loop_lag': event_loop_lag,
+                'active_handles': active_handles,
+                'open_sockets': self._get_open_sockets(connections),
+                'npm_dependencies': await self._check_npm_dependencies(process),
                 'package_json_info': self._get_package_info(process),
-                'node_version': self._get_node_version(process),
-                'environment': self._get_node_environment(process),
-                'port_status': await self._check_port_health(process)
+                'node_version': node_version,
+                'environment': environment,
+                'port_status': port_status
             })
 
         except Exception as e:
@@ -45,63 +110,85 @@ class NodeJSMonitor:
 
         return metrics
 
-    def _get_heap_usage(self, process: ManagedProcess) -> Optional[Dict[str, int]]:
+    async def _get_heap_usage(self, process: ManagedProcess) -> Optional[Dict[str, int]]:
         """Get Node.js heap usage if available"""
         try:
             # Try to read from V8 inspector if enabled
             # This would require the app to expose metrics endpoint
-            return self._try_metrics_endpoint(process)
+            return await self._try_metrics_endpoint(process)
         except:
             return None
 
-    def _try_metrics_endpoint(self, process: ManagedProcess) -> Optional[Dict[str, Any]]:
+    def _http(self) -> requests.Session:
+        """This thread's keep-alive session"""
+        session = getattr(self._http_local, 'session', None)
+        if session is None:
+            session = self._http_local.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+            )
+            session.mount('http://', adapter)
+        return session
+
+    async def _try_metrics_endpoint(self, process: ManagedProcess) -> Optional[Dict[str, Any]]:
         """Try to get metrics from common Node.js metrics endpoints"""
-        common_ports = [3000, 8000, 9229, 9230]  # Common Node.js ports
-
-        for port in common_ports:
-            try:
-                # Try common metrics endpoints
-                endpoints = ['/metrics', '/health', '/status', '/_health']
+        loop = asyncio.get_running_loop()
+        name = process.config.name
+
+        # The endpoint that answered last time usually still does
+        known_url = self._metrics_endpoints.get(name)
+        if known_url:
+            result = await loop.run_in_executor(None, self._fetch_metrics, known_url)
+            if result is not None:
+                return result
+            del self._metrics_endpoints[name]
+
+        limiter = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+        async def probe(url: str) -> Optional[Dict[str, Any]]:
+            async with limiter:
+                return await loop.run_in_executor(None, self._fetch_metrics, url)
+
+        # Probe every port/endpoint pair at once; earlier ports and endpoints still win
+        urls = [f"http://localhost:{port}{endpoint}" for port in METRICS_PORTS for endpoint in METRICS_ENDPOINTS]
+        results = await asyncio.gather(*(probe(url) for url in urls))
+        for url, result in zip(urls, results):
+            if result is not None:
+                self._metrics_endpoints[name] = url
+                return result
+        return None
 
-                for endpoint in endpoints:
-                    try:
-                        response = requests.get(f"http://localhost:{port}{endpoint}", timeout=2)
-                        if response.status_code == 200:
-                            try:
-                                return response.json()
-                            except:
-                                # Parse text metrics (Prometheus format)
-                                return self._parse_prometheus_metrics(response.text)
-                    except:
-                        continue
-            except:
-                continue
+    def _fetch_metrics(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self._http().get(url, timeout=2)
+            if response.status_code == 200:
+                try:
+                    return response.json()
+                except:
+                    # Parse text metrics (Prometheus format)
+                    return self._parse_prometheus_metrics(response.content)
+        except:
+            pass
 
         return None
 
-    def _parse_prometheus_metrics(self, text: str) -> Dict[str, Any]:
+    def _parse_prometheus_metrics(self, text: Union[str, bytes]) -> Dict[str, Any]:
         """Parse Prometheus-style metrics"""
+        data = text.encode('utf-8') if isinstance(text, str) else text
         metrics = {}
 
-        for line in text.split('\n'):
-            if line.startswith('#') or not line.strip():
-                continue
-
+        # One regex scan over the raw body; float() parses the value bytes directly
+        for key, value in _PROMETHEUS_SAMPLE.findall(data):
             try:
-                parts = line.split(' ')
-                if len(parts) >= 2:
-                    key = parts[0]
-                    value = float(parts[1])
-                    metrics[key] = value
-            except:
+                metrics[key.decode('utf-8', errors='replace')] = float(value)
+            except ValueError:
                 continue
 
         return metrics
 
-    def _get_event_loop_lag(self, process: ManagedProcess) -> Optional[float]:
+    def _get_event_loop_lag(self, ps_process: psutil.Process) -> Optional[float]:
         """Estimate event loop lag from CPU usage patterns"""
         try:
-            ps_process = psutil.Process(process.pid)
             # This is an approximation - real event loop lag needs instrumentation
             cpu_percent = ps_process.cpu_percent()
 
@@ -112,33 +199,29 @@ class NodeJSMonitor:
         except:
             return None
 
-    def _get_active_handles(self, process: ManagedProcess) -> int:
+    def _get_active_handles(self, ps_process: psutil.Process) -> int:
         """Get number of active handles (file descriptors)"""
         try:
-            ps_process = psutil.Process(process.pid)
             return ps_process.num_fds() if hasattr(ps_process, 'num_fds') else len(ps_process.open_files())
         except:
             return 0
 
-    def _get_open_sockets(self, process: ManagedProcess) -> List[Dict[str, Any]]:
-        """Get open sockets for the process"""
+    def _get_open_sockets(self, connections: List[Any]) -> List[Dict[str, Any]]:
+        """Describe the open sockets of the process"""
         try:
-            ps_process = psutil.Process(process.pid)
-            connections = []
-
-            for conn in ps_process.connections():
-                connections.append({
+            return [
+                {
                     'local_addr': f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "",
                     'remote_addr': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "",
                     'status': conn.status,
                     'type': conn.type.name if hasattr(conn.type, 'name') else str(conn.type)
-                })
-
-            return connections
+                }
+                for conn in connections
+            ]
         except:
             return []
 
-    def _check_npm_dependencies(self, process: ManagedProcess) -> Dict[str, Any]:
+    async def _check_npm_dependencies(self, process: ManagedProcess) -> Dict[str, Any]:
         """Check npm dependencies and vulnerabilities"""
         try:
             working_dir = Path(process.config.working_dir)
@@ -147,32 +230,84 @@ class NodeJSMonitor:
             if not package_json.exists():
                 return {'status': 'no_package_json'}
 
-            # Check for security vulnerabilities (if npm is available)
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ['npm', 'audit', '--json'],
-                    cwd=working_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+            # npm audit runs in the background at most once per interval; polls report its last result
+            key = str(working_dir)
+            cached = self._npm_audit_cache.get(key)
+            stale = cached is None or time.monotonic() - cached[0] >= NPM_AUDIT_INTERVAL_SECONDS
+            if stale and key not in self._npm_audit_tasks:
+                self._npm_audit_tasks[key] = asyncio.create_task(self._refresh_npm_audit(key, working_dir))
 
-                if result.returncode == 0:
-                    audit_data = json.loads(result.stdout)
-                    return {
-                        'status': 'checked',
-                        'vulnerabilities': audit_data.get('metadata', {}).get('vulnerabilities', {}),
-                        'total_dependencies': audit_data.get('metadata', {}).get('totalDependencies', 0)
-                    }
-            except:
-                pass
+            result = dict(cached[1]) if cached else {'status': 'audit_pending'}
+
+            # The dependency count comes from the lockfile, so it is current on every poll
+            locked = self._count_locked_packages(working_dir / 'package-lock.json')
+            if locked is not None:
+                result['total_dependencies'] = locked
 
-            return {'status': 'audit_unavailable'}
+            return result
 
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
 
+    def _count_locked_packages(self, package_lock: Path) -> Optional[int]:
+        """Number of installed packages in package-lock.json, reparsed only when it changes"""
+        try:
+            mtime_ns = package_lock.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        key = str(package_lock)
+        cached = self._package_lock_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        lock_data = json.loads(package_lock.read_bytes())
+        packages = lock_data.get('packages')
+        if packages is not None:
+            # Lockfile v2/v3: the '' entry is the project itself
+            count = len(packages) - ('' in packages)
+        else:
+            count = len(lock_data.get('dependencies', {}))
+
+        self._package_lock_cache[key] = (mtime_ns, count)
+        return count
+
+    async def _refresh_npm_audit(self, key: str, working_dir: Path):
+        try:
+            audit = await self._run_npm_audit(working_dir)
+        finally:
+            self._npm_audit_tasks.pop(key, None)
+        self._npm_audit_cache[key] = (time.monotonic(), audit)
+
+    async def _run_npm_audit(self, working_dir: Path) -> Dict[str, Any]:
+        """Check for security vulnerabilities (if npm is available)"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'npm', 'audit', '--json',
+                cwd=working_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            # npm audit exits non-zero when it finds vulnerabilities, so judge by the report
+            audit_data = json.loads(stdout)
+            metadata = audit_data['metadata']
+            return {
+                'status': 'checked',
+                'vulnerabilities': metadata.get('vulnerabilities', {}),
+                'total_dependencies': metadata.get('totalDependencies', 0)
+            }
+        except Exception:
+            pass
+
+        return {'status': 'audit_unavailable'}
+
     def _get_package_info(self, process: ManagedProcess) -> Dict[str, Any]:
         """Get package.json information"""
         try:
@@ -180,8 +315,7 @@ class NodeJSMonitor:
             package_json = working_dir / 'package.json'
 
             if package_json.exists():
-                with open(package_json, 'r') as f:
-                    data = json.load(f)
+                data = self._load_package_json(package_json)
 
                 return {
                     'name': data.get('name', 'unknown'),
@@ -197,10 +331,22 @@ class NodeJSMonitor:
 
         return {'status': 'unavailable'}
 
-    def _get_node_version(self, process: ManagedProcess) -> Optional[str]:
+    def _load_package_json(self, path: Path) -> Dict:
+        """Load package.json, reusing the parsed result while the file is unchanged"""
+        key = str(path)
+        mtime_ns = path.stat().st_mtime_ns
+
+        cached = self._package_json_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        package_data = json.loads(path.read_bytes())
+        self._package_json_cache[key] = (mtime_ns, package_data)
+        return package_data
+
+    def _get_node_version(self, ps_process: psutil.Process) -> Optional[str]:
         """Get Node.js version"""
         try:
-            ps_process = psutil.Process(process.pid)
             cmdline = ps_process.cmdline()
 
             # Extract Node.js executable path
@@ -214,10 +360,9 @@ class NodeJSMonitor:
 
         return None
 
-    def _get_node_environment(self, process: ManagedProcess) -> Dict[str, str]:
+    def _get_node_environment(self, ps_process: psutil.Process) -> Dict[str, str]:
         """Get Node.js environment variables"""
         try:
-            ps_process = psutil.Process(process.pid)
             environ = ps_process.environ()
 
             node_env_vars = {}
@@ -229,64 +374,61 @@ class NodeJSMonitor:
         except:
             return {}
 
-    async def _check_port_health(self, process: ManagedProcess) -> Dict[str, Any]:
+    async def _check_port_health(self, connections: List[Any],
+                                 connections_error: Optional[Exception] = None) -> Dict[str, Any]:
         """Check if the Node.js server is responding on its port"""
+        if connections_error is not None:
+            return {'error': str(connections_error)}
+
         try:
             # Get ports the process is listening on
-            ps_process = psutil.Process(process.pid)
             listening_ports = []
 
-            for conn in ps_process.connections():
+            for conn in connections:
                 if conn.status == psutil.CONN_LISTEN and conn.laddr:
                     listening_ports.append(conn.laddr.port)
 
-            port_status = {}
-            for port in listening_ports:
-                try:
-                    response = requests.get(f"http://localhost:{port}", timeout=3)
-                    port_status[port] = {
-                        'status': 'responding',
-                        'http_status': response.status_code,
-                        'response_time': response.elapsed.total_seconds()
-                    }
-                except requests.exceptions.ConnectionError:
-                    port_status[port] = {'status': 'connection_refused'}
-                except requests.exceptions.Timeout:
-                    port_status[port] = {'status': 'timeout'}
-                except Exception as e:
-                    port_status[port] = {'status': 'error', 'error': str(e)}
-
-            return port_status
+            # Probe all ports at once, so the worst case is one timeout rather than their sum
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, self._probe_port, port) for port in listening_ports)
+            )
+            return dict(zip(listening_ports, results))
 
         except Exception as e:
             return {'error': str(e)}
 
+    def _probe_port(self, port: int) -> Dict[str, Any]:
+        try:
+            response = self._http().get(f"http://localhost:{port}", timeout=3)
+            return {
+                'status': 'responding',
+                'http_status': response.status_code,
+                'response_time': response.elapsed.total_seconds()
+            }
+        except requests.exceptions.ConnectionError:
+            return {'status': 'connection_refused'}
+        except requests.exceptions.Timeout:
+            return {'status': 'timeout'}
+        except Exception as e:
+            return {'status': 'error', 'error': str(e)}
+
     def detect_nodejs_crashes(self, process: ManagedProcess, log_lines: List[str]) -> List[Dict[str, Any]]:
         """Detect Node.js specific crash patterns"""
         crashes = []
 
-        crash_patterns = [
-            (r'Error: Cannot find module', 'missing_module'),
-            (r'ReferenceError:', 'reference_error'),
-            (r'TypeError:', 'type_error'),
-            (r'SyntaxError:', 'syntax_error'),
-            (r'EADDRINUSE.*address already in use', 'port_in_use'),
-            (r'ECONNREFUSED', 'connection_refused'),
-            (r'UnhandledPromiseRejectionWarning', 'unhandled_promise'),
-            (r'MaxListenersExceededWarning', 'memory_leak_warning'),
-            (r'FATAL ERROR:.*JavaScript heap out of memory', 'heap_overflow'),
-            (r'segmentation fault', 'segfault'),
-            (r'Error: spawn.*ENOENT', 'spawn_error')
-        ]
-
+        detected_at = datetime.now().isoformat()
         for line in log_lines[-100:]:  # Check last 100 lines
-            for pattern, error_type in crash_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
+            if not _CRASH_PATTERN.search(line):
+                continue
+
+            for pattern, error_type, regex in _CRASH_PATTERN_CHECKS:
+                if regex.search(line):
                     crashes.append({
                         'type': error_type,
                         'pattern': pattern,
                         'line': line,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': detected_at
                     })
 
         return crashes
@@ -4,18 +4,47 @@ import time
 import os
 import signal
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from ..models.process import ManagedProcess, ProcessConfig, ProcessStatus, ProcessMetrics
 from ..utils.logging import get_logger
 
+_METRIC_ATTRS = ['cpu_percent', 'memory_percent', 'memory_info', 'open_files', 'num_threads']
+
 class ProcessManager:
     def __init__(self):
         self.processes: Dict[str, ManagedProcess] = {}
         self.logger = get_logger(__name__)
         self._subprocess_handles: Dict[str, subprocess.Popen] = {}
+        # Raw psutil connections from the latest metrics read, with the pid they belong to
+        self._connections_cache: Dict[str, Tuple[int, List[Any]]] = {}
+        # SIGCHLD count and the count each handle was last polled at; health checks
+        # skip Popen.poll() until a child has exited since then
+        self._child_exits = 0
+        self._polled_at: Dict[str, int] = {}
+        self._sigchld_installed = self._install_sigchld_handler()
+
+    def _install_sigchld_handler(self) -> bool:
+        """Count child exits; returns False where SIGCHLD can't be handled"""
+        if not hasattr(signal, 'SIGCHLD'):
+            return False
+
+        previous = signal.getsignal(signal.SIGCHLD)
+
+        def on_sigchld(signum, frame):
+            # Only count here: reaping would race Popen and asyncio subprocess waits
+            self._child_exits += 1
+            if callable(previous):
+                previous(signum, frame)
+
+        try:
+            signal.signal(signal.SIGCHLD, on_sigchld)
+        except ValueError:
+            # Handlers can only be installed from the main thread
+            return False
+        return True
 
     def add_process(self, config: ProcessConfig) -> bool:
         if config.name in self.processes:
@@ -36,6 +65,8 @@ class ProcessManager:
         del self.processes[name]
         if name in self._subprocess_handles:
             del self._subprocess_handles[name]
+        self._connections_cache.pop(name, None)
+        self._polled_at.pop(name, None)
 
         self.logger.info(f"Removed process: {name}")
         return True
@@ -54,8 +85,8 @@ class ProcessManager:
             process.status = ProcessStatus.STARTING
             config = process.config
 
-            env = os.environ.copy()
-            env.update(config.env_vars)
+            # Without extra variables the child inherits our environment as is
+            env = {**os.environ, **config.env_vars} if config.env_vars else None
 
             working_dir = Path(config.working_dir)
             if not working_dir.exists():
@@ -68,16 +99,22 @@ class ProcessManager:
             stdout = log_file if log_file else (subprocess.PIPE if config.redirect_output else None)
             stderr = subprocess.STDOUT if log_file else (subprocess.PIPE if config.redirect_output else None)
 
-            popen = subprocess.Popen(
-                config.command.split(),
-                cwd=str(working_dir),
-                env=env,
-                stdout=stdout,
-                stderr=stderr,
-                preexec_fn=os.setsid if os.name != 'nt' else None
-            )
+            try:
+                popen = subprocess.Popen(
+                    config.argv,
+                    cwd=str(working_dir),
+                    env=env,
+                    stdout=stdout,
+                    stderr=stderr,
+                    start_new_session=os.name != 'nt'
+                )
+            finally:
+                # The child holds its own copy of the descriptor
+                if log_file:
+                    log_file.close()
 
             self._subprocess_handles[name] = popen
+            self._polled_at.pop(name, None)
             process.pid = popen.pid
             process.started_at = datetime.now()
             process.status = ProcessStatus.RUNNING
@@ -174,45 +211,53 @@ class ProcessManager:
             )
 
         try:
-            ps_process = psutil.Process(process.pid)
+            ps_process = process._ps
+            if ps_process is None or ps_process.pid != process.pid:
+                ps_process = process._ps = psutil.Process(process.pid)
 
             uptime = (datetime.now() - process.started_at).total_seconds() if process.started_at else 0.0
 
-            connections = []
-            try:
-                for conn in ps_process.connections():
-                    connections.append({
-                        "local_address": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "",
-                        "remote_address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "",
-                        "status": conn.status,
-                        "type": conn.type.name if hasattr(conn.type, 'name') else str(conn.type)
-                    })
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                pass
+            with ps_process.oneshot():
+                connections = []
+                try:
+                    # Kept so monitors polling the same process reuse this socket table read
+                    raw_connections = ps_process.connections(kind='inet')
+                    self._connections_cache[name] = (process.pid, raw_connections)
+                    for conn in raw_connections:
+                        connections.append({
+                            "local_address": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "",
+                            "remote_address": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "",
+                            "status": conn.status,
+                            "type": conn.type.name if hasattr(conn.type, 'name') else str(conn.type)
+                        })
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    self._connections_cache.pop(name, None)
+
+                # One batched read of the /proc entries behind these attributes
+                info = ps_process.as_dict(attrs=_METRIC_ATTRS, ad_value=None)
+            memory_info = info['memory_info']
 
             metrics = ProcessMetrics(
                 timestamp=datetime.now(),
                 pid=process.pid,
-                cpu_percent=ps_process.cpu_percent(),
-                memory_percent=ps_process.memory_percent(),
-                memory_mb=ps_process.memory_info().rss / 1024 / 1024,
-                open_files=len(ps_process.open_files()),
+                cpu_percent=info['cpu_percent'] or 0.0,
+                memory_percent=info['memory_percent'] or 0.0,
+                memory_mb=memory_info.rss / 1024 / 1024 if memory_info else 0.0,
+                open_files=len(info['open_files'] or ()),
                 connections=connections,
-                threads=ps_process.num_threads(),
+                threads=info['num_threads'] or 0,
                 status=process.status,
                 uptime=uptime
             )
 
             process.metrics_history.append(metrics)
 
-            if len(process.metrics_history) > 1000:
-                process.metrics_history = process.metrics_history[-500:]
-
             return metrics
 
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             process.status = ProcessStatus.FAILED
             process.pid = None
+            process._ps = None
             return ProcessMetrics(
                 timestamp=datetime.now(),
                 pid=None,
@@ -226,6 +271,14 @@ class ProcessManager:
                 uptime=0.0
             )
 
+    def get_cached_connections(self, name: str) -> Optional[List[Any]]:
+        """Raw connections read by the last get_process_metrics call, if still for the current pid"""
+        process = self.processes.get(name)
+        cached = self._connections_cache.get(name)
+        if process and cached and cached[0] == process.pid:
+            return cached[1]
+        return None
+
     def check_process_health(self, name: str) -> bool:
         if name not in self.processes:
             return False
@@ -233,11 +286,17 @@ class ProcessManager:
         process = self.processes[name]
 
         if name in self._subprocess_handles:
+            exits = self._child_exits
+            if self._sigchld_installed and self._polled_at.get(name) == exits:
+                return process.status == ProcessStatus.RUNNING
+
             popen = self._subprocess_handles[name]
+            self._polled_at[name] = exits
             if popen.poll() is not None:
                 process.status = ProcessStatus.FAILED
                 process.pid = None
                 del self._subprocess_handles[name]
+                del self._polled_at[name]
                 self.logger.warning(f"Process {name} has died")
                 return False
 
@@ -252,10 +311,16 @@ class ProcessManager:
                 self.logger.info(f"Auto-restarting failed process: {name}")
                 self.restart_process(name)
 
+    def get_blocked_processes(self) -> Set[str]:
+        return set()
+
     def get_all_processes(self) -> Dict[str, ManagedProcess]:
         return self.processes.copy()
 
     def cleanup(self):
         for name in list(self.processes.keys()):
             if self.processes[name].status == ProcessStatus.RUNNING:
-                self.stop_process(name, force=True)
\ No newline at end of file
+                self.stop_process(name, force=True)
+
+    async def close(self):
+        """Release monitoring resources; the base manager holds none"""
\ No newline at end of file
@@ -1,22 +1,72 @@
+import os
 import re
+import bisect
 import hashlib
+import ipaddress
+import select
+import time
 import subprocess
 import psutil
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from datetime import datetime
 from pathlib import Path
 import json
+from collections import deque
 
 from ..utils.logging import get_logger
 
+SECURITY_EVENTS_MAXLEN = 10000
+
+# Points deducted from the security score per issue; unknown severities cost nothing
+SEVERITY_POINTS = {'critical': 25, 'high': 15, 'medium': 10, 'low': 5}
+
+VULNERABILITY_LOOKUP_TTL = 24 * 60 * 60  # seconds
+
+# Any one credential-looking assignment is enough, so the patterns are searched as one alternation
+_CREDENTIAL_PATTERN = re.compile(r'(?:password|api[_-]?key|secret|token)[=\s]+[\w\d]+', re.IGNORECASE)
+DEBUG_FLAGS = ('--debug', '--dev', '--development', '--verbose')
+
+SENSITIVE_PATHS = (
+    '/etc/passwd', '/etc/shadow', '/etc/hosts',
+    '/home/', '/root/', '/var/log/',
+    '/.ssh/', '/etc/ssl/'
+)
+HIGH_RISK_FILES = frozenset(('/etc/passwd', '/etc/shadow'))
+
+# No sensitive path is a prefix of another, so at most one can match
+_SENSITIVE_PATH = re.compile('|'.join(map(re.escape, SENSITIVE_PATHS)))
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Descriptor that becomes readable when pid exits and can't be confused with a reused pid"""
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+def _pidfd_exited(pidfd: Optional[int]) -> bool:
+    """Whether the process behind a pidfd has exited; False where pidfds are unavailable"""
+    if pidfd is None:
+        return False
+    readable, _, _ = select.select([pidfd], [], [], 0)
+    return bool(readable)
+
 class SecurityMonitor:
     """Enterprise security and compliance monitoring"""
 
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.security_events = []
-        self.vulnerability_cache = {}
+        self.security_events: Deque[Dict[str, Any]] = deque(maxlen=SECURITY_EVENTS_MAXLEN)
+        # executable path -> ((mtime_ns, size), sha256)
+        self.vulnerability_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        # sha256 -> (looked up at, findings)
+        self._vulnerability_lookups: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
         self.compliance_rules = self._load_compliance_rules()
+        # IP version -> (sorted range starts, matching range ends)
+        self._suspicious_ranges: Dict[int, Tuple[List[int], List[int]]] = {}
+        # pid -> handle whose cpu_percent() measures usage since that process's previous scan
+        self._scanned_processes: Dict[int, psutil.Process] = {}
 
     def _load_compliance_rules(self) -> Dict[str, Any]:
         """Load compliance rules (SOC2, GDPR, HIPAA, etc.)"""
@@ -45,38 +95,44 @@ class SecurityMonitor:
 
     async def scan_process_security(self, process_name: str, pid: int) -> Dict[str, Any]:
         """Comprehensive security scan of a process"""
+        now = datetime.now()
         security_report = {
             'process_name': process_name,
             'pid': pid,
-            'timestamp': datetime.now(),
+            'timestamp': now,
             'vulnerabilities': [],
             'security_score': 100,
             'compliance_issues': [],
             'recommendations': []
         }
 
+        pidfd = _open_pidfd(pid)
         try:
-            ps_process = psutil.Process(pid)
+            ps_process, has_cpu_baseline = self._tracked_process(pid)
 
-            # Check process privileges
-            privilege_check = await self._check_process_privileges(ps_process)
-            security_report.update(privilege_check)
+            # All checks share one read of each /proc source
+            with ps_process.oneshot():
+                # Check process privileges
+                privilege_check = await self._check_process_privileges(ps_process)
+                security_report.update(privilege_check)
 
-            # Check network security
-            network_check = await self._check_network_security(ps_process)
-            security_report.update(network_check)
+                # Check network security
+                network_check = await self._check_network_security(ps_process)
+                security_report.update(network_check)
 
-            # Check file access patterns
-            file_check = await self._check_file_access(ps_process)
-            security_report.update(file_check)
+                # Check file access patterns
+                file_check = await self._check_file_access(ps_process)
+                security_report.update(file_check)
 
-            # Check for suspicious behavior
-            behavior_check = await self._check_suspicious_behavior(ps_process)
-            security_report.update(behavior_check)
+                # Check for suspicious behavior
+                behavior_check = await self._check_suspicious_behavior(ps_process, has_cpu_baseline, now.timestamp())
+                security_report.update(behavior_check)
 
-            # Vulnerability scanning
-            vuln_check = await self._scan_vulnerabilities(process_name, ps_process)
-            security_report['vulnerabilities'].extend(vuln_check)
+                # Vulnerability scanning (hashes the executable, so skipped once the process is gone)
+                if _pidfd_exited(pidfd):
+                    raise psutil.NoSuchProcess(pid, process_name)
+                vuln_check = await self._scan_vulnerabilities(process_name, ps_process)
+                security_report['vulnerabilities'].extend(vuln_check)
 
             # Calculate security score
             security_report['security_score'] = self._calculate_security_score(security_report)
@@ -84,9 +140,27 @@ class SecurityMonitor:
         except Exception as e:
             self.logger.error(f"Security scan failed for {process_name}: {e}")
             security_report['error'] = str(e)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
         return security_report
 
+    def _tracked_process(self, pid: int) -> Tuple[psutil.Process, bool]:
+        """Process handle kept between scans, and whether it already has a CPU usage baseline"""
+        process = self._scanned_processes.get(pid)
+        if process is not None and process.is_running():
+            return process, True
+
+        # A new or reused pid; drop handles of processes that have gone since
+        self._scanned_processes = {
+            tracked_pid: tracked for tracked_pid, tracked in self._scanned_processes.items()
+            if tracked_pid != pid and tracked.is_running()
+        }
+        process = psutil.Process(pid)
+        self._scanned_processes[pid] = process
+        return process, False
+
     async def _check_process_privileges(self, process: psutil.Process) -> Dict[str, Any]:
         """Check process privilege escalation and user context"""
         try:
@@ -183,17 +257,47 @@ class SecurityMonitor:
         except Exception as e:
             return {'network_check': {'error': str(e)}}
 
+    def load_suspicious_ranges(self, cidrs: List[str]):
+        """Load threat intelligence CIDR ranges that mark connections as suspicious"""
+        intervals: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        for cidr in cidrs:
+            network = ipaddress.ip_network(cidr, strict=False)
+            intervals[network.version].append((int(network.network_address), int(network.broadcast_address)))
+
+        # Overlapping ranges are merged so only the nearest start below an address can contain it
+        ranges = {}
+        for version, spans in intervals.items():
+            starts: List[int] = []
+            ends: List[int] = []
+            for start, end in sorted(spans):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            if starts:
+                ranges[version] = (starts, ends)
+        self._suspicious_ranges = ranges
+
     def _is_suspicious_ip(self, ip: str) -> bool:
         """Check if IP is in known suspicious ranges"""
-        # This would integrate with threat intelligence feeds
-        suspicious_ranges = [
-            '10.0.0.0/8',    # Private ranges shouldn't be external
-            '172.16.0.0/12',
-            '192.168.0.0/16'
-        ]
-
-        # In real implementation, check against threat intel feeds
-        return False
+        # Ranges come from threat intelligence feeds via load_suspicious_ranges
+        if not self._suspicious_ranges:
+            return False
+
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+
+        ranges = self._suspicious_ranges.get(address.version)
+        if not ranges:
+            return False
+
+        starts, ends = ranges
+        value = int(address)
+        index = bisect.bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
 
     async def _check_file_access(self, process: psutil.Process) -> Dict[str, Any]:
         """Check file access patterns for security issues"""
@@ -201,32 +305,26 @@ class SecurityMonitor:
             open_files = process.open_files()
             issues = []
 
-            sensitive_paths = [
-                '/etc/passwd', '/etc/shadow', '/etc/hosts',
-                '/home/', '/root/', '/var/log/',
-                '/.ssh/', '/etc/ssl/'
-            ]
-
             sensitive_file_access = []
 
             for file_info in open_files:
                 file_path = file_info.path
 
                 # Check for sensitive file access
-                for sensitive_path in sensitive_paths:
-                    if file_path.startswith(sensitive_path):
-                        sensitive_file_access.append({
-                            'path': file_path,
-                            'mode': file_info.mode
-                        })
+                match = _SENSITIVE_PATH.match(file_path)
+                if match:
+                    sensitive_file_access.append({
+                        'path': file_path,
+                        'mode': file_info.mode
+                    })
 
-                        if sensitive_path in ['/etc/passwd', '/etc/shadow']:
-                            issues.append({
-                                'type': 'sensitive_file_access',
-                                'severity': 'high',
-                                'description': f'Access to sensitive file: {file_path}',
-                                'recommendation': 'Verify legitimate access need'
-                            })
+                    if match.group(0) in HIGH_RISK_FILES:
+                        issues.append({
+                            'type': 'sensitive_file_access',
+                            'severity': 'high',
+                            'description': f'Access to sensitive file: {file_path}',
+                            'recommendation': 'Verify legitimate access need'
+                        })
 
                 # Check for temporary file creation in insecure locations
                 if '/tmp/' in file_path and file_info.mode == 'w':
@@ -248,14 +346,19 @@ class SecurityMonitor:
         except Exception as e:
             return {'file_access_check': {'error': str(e)}}
 
-    async def _check_suspicious_behavior(self, process: psutil.Process) -> Dict[str, Any]:
+    async def _check_suspicious_behavior(self, process: psutil.Process,
+                                         has_cpu_baseline: bool = True,
+                                         now: Optional[float] = None) -> Dict[str, Any]:
         """Check for suspicious process behavior patterns"""
         try:
             issues = []
 
-            # Check CPU usage pattern (potential crypto mining)
-            cpu_percent = process.cpu_percent(interval=1)
-            if cpu_percent > 90:
+            # Check CPU usage pattern (potential crypto mining); usage since the previous scan,
+            # so a process's first scan only sets the baseline
+            cpu_percent = process.cpu_percent(interval=None)
+            if not has_cpu_baseline:
+                cpu_percent = None
+            if cpu_percent is not None and cpu_percent > 90:
                 issues.append({
                     'type': 'high_cpu_usage',
                     'severity': 'medium',
@@ -274,8 +377,8 @@ class SecurityMonitor:
                 })
 
             # Check process creation pattern
-            create_time = datetime.fromtimestamp(process.create_time())
-            if datetime.now() - create_time < timedelta(minutes=5):
+            uptime = (now if now is not None else time.time()) - process.create_time()
+            if uptime < 5 * 60:
                 # Recently created process - check if it's frequently restarting
                 cmdline = ' '.join(process.cmdline())
                 if self._is_frequent_restart_pattern(cmdline):
@@ -290,7 +393,7 @@ class SecurityMonitor:
                 'behavior_check': {
                     'cpu_percent': cpu_percent,
                     'memory_mb': memory_info.rss / 1024 / 1024,
-                    'uptime_minutes': (datetime.now() - create_time).total_seconds() / 60,
+                    'uptime_minutes': uptime / 60,
                     'issues': issues
                 }
             }
@@ -331,22 +434,28 @@ class SecurityMonitor:
         vulnerabilities = []
 
         try:
-            # Get file hash
+            # Get file hash (reused while the executable is unchanged)
             file_hash = self._get_file_hash(exe_path)
 
-            # Check against known vulnerable hashes (would integrate with CVE databases)
-            # This is a placeholder - real implementation would check against:
-            # - National Vulnerability Database (NVD)
-            # - CVE databases
-            # - Security vendor feeds
+            # Database answers are kept per content hash, so rescans and identical binaries
+            # elsewhere skip the lookup until it expires and newly published entries are seen
+            now = time.monotonic()
+            cached = self._vulnerability_lookups.get(file_hash) if file_hash else None
+            if cached and now - cached[0] < VULNERABILITY_LOOKUP_TTL:
+                findings = cached[1]
+            else:
+                findings = self._lookup_vulnerabilities(file_hash)
+                if file_hash:
+                    self._vulnerability_lookups[file_hash] = (now, findings)
 
             vulnerabilities.append({
                 'type': 'vulnerability_scan',
                 'file_path': exe_path,
                 'file_hash': file_hash,
                 'status': 'scanned',
-                'vulnerabilities_found': 0
+                'vulnerabilities_found': len(findings)
             })
+            vulnerabilities.extend(findings)
 
         except Exception as e:
             vulnerabilities.append({
@@ -356,14 +465,37 @@ class SecurityMonitor:
 
         return vulnerabilities
 
+    def _lookup_vulnerabilities(self, file_hash: str) -> List[Dict[str, Any]]:
+        """Known vulnerabilities for an executable's hash"""
+        # Check against known vulnerable hashes (would integrate with CVE databases)
+        # This is a placeholder - real implementation would check against:
+        # - National Vulnerability Database (NVD)
+        # - CVE databases
+        # - Security vendor feeds
+        return []
+
     def _get_file_hash(self, file_path: str) -> str:
-        """Get SHA256 hash of file"""
+        """Get SHA256 hash of file, reusing it while the file's mtime and size are unchanged"""
         try:
-            sha256_hash = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+                stat_info = os.fstat(f.fileno())
+                version = (stat_info.st_mtime_ns, stat_info.st_size)
+
+                cached = self.vulnerability_cache.get(file_path)
+                if cached and cached[0] == version:
+                    return cached[1]
+
+                if hasattr(hashlib, 'file_digest'):
+                    file_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    # hashlib.file_digest is Python 3.11+
+                    sha256_hash = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(64 * 1024), b""):
+                        sha256_hash.update(chunk)
+                    file_hash = sha256_hash.hexdigest()
+
+            self.vulnerability_cache[file_path] = (version, file_hash)
+            return file_hash
         except:
             return ""
 
@@ -376,33 +508,24 @@ class SecurityMonitor:
             cmdline_str = ' '.join(cmdline)
 
             # Check for hardcoded credentials in command line
-            credential_patterns = [
-                r'password[=\s]+[\w\d]+',
-                r'api[_-]?key[=\s]+[\w\d]+',
-                r'secret[=\s]+[\w\d]+',
-                r'token[=\s]+[\w\d]+'
-            ]
-
-            for pattern in credential_patterns:
-                if re.search(pattern, cmdline_str, re.IGNORECASE):
-                    issues.append({
-                        'type': 'credential_exposure',
-                        'severity': 'critical',
-                        'description': 'Potential credentials in command line',
-                        'recommendation': 'Use environment variables or config files'
-                    })
-                    break
+            if _CREDENTIAL_PATTERN.search(cmdline_str):
+                issues.append({
+                    'type': 'credential_exposure',
+                    'severity': 'critical',
+                    'description': 'Potential credentials in command line',
+                    'recommendation': 'Use environment variables or config files'
+                })
 
             # Check for debug/development flags in production
-            debug_patterns = ['--debug', '--dev', '--development', '--verbose']
-            for pattern in debug_patterns:
-                if pattern in cmdline_str:
-                    issues.append({
-                        'type': 'debug_mode',
-                        'severity': 'low',
-                        'description': f'Debug/development flag detected: {pattern}',
-                        'recommendation': 'Remove debug flags in production'
-                    })
+            if '--' in cmdline_str:
+                for pattern in DEBUG_FLAGS:
+                    if pattern in cmdline_str:
+                        issues.append({
+                            'type': 'debug_mode',
+                            'severity': 'low',
+                            'description': f'Debug/development flag detected: {pattern}',
+                            'recommendation': 'Remove debug flags in production'
+                        })
 
         except Exception as e:
             issues.append({
@@ -414,51 +537,29 @@ class SecurityMonitor:
 
     def _calculate_security_score(self, security_report: Dict[str, Any]) -> int:
         """Calculate overall security score (0-100)"""
-        score = 100
-
-        # Deduct points for issues
-        all_issues = []
-        for check_name, check_data in security_report.items():
-            if isinstance(check_data, dict) and 'issues' in check_data:
-                all_issues.extend(check_data['issues'])
-
-        for issue in all_issues:
-            severity = issue.get('severity', 'low')
-            if severity == 'critical':
-                score -= 25
-            elif severity == 'high':
-                score -= 15
-            elif severity == 'medium':
-                score -= 10
-            elif severity == 'low':
-                score -= 5
-
-        return max(0, score)
+        deductions = sum(
+            SEVERITY_POINTS.get(issue.get('severity', 'low'), 0)
+            for check_data in security_report.values()
+            if isinstance(check_data, dict)
+            for issue in check_data.get('issues', ())
+        )
+        return max(0, 100 - deductions)
 
     async def generate_compliance_report(self, processes: List[str]) -> Dict[str, Any]:
         """Generate compliance report for multiple processes"""
-        report = {
-            'timestamp': datetime.now(),
+        now = datetime.now()
+        # This would scan each process for compliance (concurrently, via asyncio.gather)
+        # Placeholder for full implementation
+        process_score = 85  # Example score
+
+        return {
+            'timestamp': now,
             'processes_scanned': len(processes),
-            'compliance_status': {},
+            'compliance_status': {
+                process_name: {'score': process_score, 'last_scanned': now}
+                for process_name in processes
+            },
             'violations': [],
             'recommendations': [],
-            'overall_score': 0
-        }
-
-        total_score = 0
-
-        for process_name in processes:
-            # This would scan each process for compliance
-            # Placeholder for full implementation
-            process_score = 85  # Example score
-            total_score += process_score
-
-            report['compliance_status'][process_name] = {
-                'score': process_score,
-                'last_scanned': datetime.now()
-            }
-
-        report['overall_score'] = total_score / len(processes) if processes else 0
-
-        return report
\ No newline at end of file
+            'overall_score': float(process_score) if processes else 0
+        }
\ No newline at end of file
@@ -1,75 +1,180 @@
+import asyncio
+import os
 import psutil
 import platform
 import socket
-from typing import List, Dict, Any
+import sys
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from ..models.system import SystemMetrics, SystemInfo, PortInfo
 from ..utils.logging import get_logger
 
+CONNECTIONS_SNAPSHOT_TTL = 1.0  # seconds
+DISK_USAGE_WORKERS = 8
+DISK_USAGE_TIMEOUT = 0.5  # seconds
+
 class SystemMonitor:
     def __init__(self):
         self.logger = get_logger(__name__)
 
-    def get_system_info(self) -> SystemInfo:
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
+        # Fixed for the life of the daemon, so read once instead of from /proc on every call
+        self._boot_timestamp = psutil.boot_time()
+        self._boot_time = datetime.fromtimestamp(self._boot_timestamp)
+        self._cpu_count = psutil.cpu_count()
+        self._cpu_count_physical = psutil.cpu_count(logical=False)
+        self._hostname = socket.gethostname()
+        self._platform = platform.system()
+        self._architecture = platform.machine()
 
-        return SystemInfo(
-            hostname=socket.gethostname(),
-            platform=platform.system(),
-            architecture=platform.machine(),
-            cpu_count=psutil.cpu_count(),
-            total_memory=psutil.virtual_memory().total,
-            boot_time=boot_time,
-            open_ports=self.get_open_ports()
-        )
+        # Sets psutil's baseline, so each metrics call reports usage since the previous one
+        # instead of sleeping a second to measure it
+        psutil.cpu_percent(interval=None)
 
-    def get_system_metrics(self) -> SystemMetrics:
-        memory = psutil.virtual_memory()
+        # One system-wide socket scan serves every caller within CONNECTIONS_SNAPSHOT_TTL
+        self._connections_snapshot: Optional[Tuple[float, List[Any]]] = None
+        self._connections_lock = threading.Lock()
+        # statvfs can hang on stale network mounts, so it runs on workers the tick never waits out
+        self._disk_usage_pool = ThreadPoolExecutor(max_workers=DISK_USAGE_WORKERS, thread_name_prefix="disk-usage")
+        self._disk_usage_pending: Dict[str, Future] = {}
 
-        disk_usage = {}
+        # pid -> name for the sockets in the current snapshot
+        self._process_names: Dict[int, str] = {}
+
+        # (pid, start time) -> CPU ticks at the previous process tree read, for per-process CPU usage
+        self._tree_cpu_ticks: Dict[Tuple[int, bytes], int] = {}
+        self._tree_sampled_at: Optional[float] = None
+        if psutil.LINUX:
+            self._total_memory = psutil.virtual_memory().total
+            self._clock_ticks = os.sysconf('SC_CLK_TCK')
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+
+    def _snapshot_connections(self) -> List[Any]:
+        """Get inet connections, rescanning /proc/net at most once per CONNECTIONS_SNAPSHOT_TTL"""
+        with self._connections_lock:
+            now = time.monotonic()
+            snapshot = self._connections_snapshot
+            if snapshot is None or now - snapshot[0] >= CONNECTIONS_SNAPSHOT_TTL:
+                snapshot = (now, psutil.net_connections(kind='inet'))
+                self._connections_snapshot = snapshot
+                self._process_names = {}
+            return snapshot[1]
+
+    def _probe_disk_usage(self) -> Dict[str, Any]:
+        """statvfs every partition in parallel; mounts that don't answer in time are left out"""
+        futures = {}
         for partition in psutil.disk_partitions():
+            mountpoint = partition.mountpoint
+            pending = self._disk_usage_pending.get(mountpoint)
+            if pending is not None and not pending.done():
+                # Still stuck from an earlier tick; don't tie up another worker on it
+                continue
+            future = self._disk_usage_pool.submit(psutil.disk_usage, mountpoint)
+            self._disk_usage_pending[mountpoint] = future
+            futures[mountpoint] = future
+
+        if futures:
+            wait(futures.values(), timeout=DISK_USAGE_TIMEOUT)
+
+        usages = {}
+        for mountpoint, future in futures.items():
+            if not future.done():
+                self.logger.warning(f"Disk usage for {mountpoint} timed out")
+                continue
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_usage[partition.mountpoint] = {
-                    "total": usage.total,
-                    "used": usage.used,
-                    "free": usage.free,
-                    "percent": (usage.used / usage.total) * 100
-                }
+                usages[mountpoint] = future.result()
             except (PermissionError, OSError):
                 continue
+        return usages
 
-        network_io = psutil.net_io_counters()._asdict()
+    def _process_name(self, pid: Optional[int]) -> str:
+        """Name of a socket's owning process, read once per pid per connections snapshot"""
+        if not pid:
+            return "unknown"
 
-        active_connections = len(psutil.net_connections())
+        names = self._process_names
+        name = names.get(pid)
+        if name is None:
+            try:
+                # Worker pools share a name, so their ports and connections share one string
+                name = sys.intern(psutil.Process(pid).name())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                name = "unknown"
+            names[pid] = name
+        return name
 
-        uptime = (datetime.now() - datetime.fromtimestamp(psutil.boot_time())).total_seconds()
+    def close(self):
+        """Stop the disk usage workers; a probe stuck on a dead mount is not waited for"""
+        self._disk_usage_pool.shutdown(wait=False)
+
+    def get_system_info(self) -> SystemInfo:
+        return SystemInfo(
+            hostname=self._hostname,
+            platform=self._platform,
+            architecture=self._architecture,
+            cpu_count=self._cpu_count,
+            total_memory=psutil.virtual_memory().total,
+            boot_time=self._boot_time,
+            open_ports=self.get_open_ports()
+        )
+
+    def get_system_metrics(self) -> SystemMetrics:
+        return self._build_system_metrics(
+            psutil.virtual_memory(),
+            self._probe_disk_usage(),
+            psutil.net_io_counters(),
+            self._snapshot_connections()
+        )
+
+    def _build_system_metrics(self, memory, disks: Dict[str, Any], net_io, connections: List[Any]) -> SystemMetrics:
+        disk_usage = {}
+        for mountpoint, usage in disks.items():
+            disk_usage[mountpoint] = {
+                "total": usage.total,
+                "used": usage.used,
+                "free": usage.free,
+                "percent": (usage.used / usage.total) * 100
+            }
+
+        uptime = time.time() - self._boot_timestamp
 
         return SystemMetrics(
             timestamp=datetime.now(),
-            cpu_percent=psutil.cpu_percent(interval=1),
+            cpu_percent=psutil.cpu_percent(interval=None),
             memory_percent=memory.percent,
             memory_total=memory.total,
             memory_available=memory.available,
             disk_usage=disk_usage,
-            network_io=network_io,
+            network_io=net_io._asdict(),
             load_average=psutil.getloadavg() if hasattr(psutil, 'getloadavg') else [0.0, 0.0, 0.0],
             uptime=uptime,
-            active_connections=active_connections
+            active_connections=len(connections)
+        )
+
+    async def get_system_info_async(self) -> SystemInfo:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_system_info)
+
+    async def get_system_metrics_async(self) -> SystemMetrics:
+        # The probes are independent, so a slow mount or socket table doesn't hold up the rest
+        loop = asyncio.get_running_loop()
+        memory, disks, net_io, connections = await asyncio.gather(
+            loop.run_in_executor(None, psutil.virtual_memory),
+            loop.run_in_executor(None, self._probe_disk_usage),
+            loop.run_in_executor(None, psutil.net_io_counters),
+            loop.run_in_executor(None, self._snapshot_connections)
         )
+        return self._build_system_metrics(memory, disks, net_io, connections)
 
     def get_open_ports(self) -> List[PortInfo]:
         ports = []
-        connections = psutil.net_connections(kind='inet')
+        connections = self._snapshot_connections()
 
         for conn in connections:
             if conn.status == psutil.CONN_LISTEN and conn.laddr:
-                try:
-                    process = psutil.Process(conn.pid) if conn.pid else None
-                    process_name = process.name() if process else "unknown"
-                except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                    process_name = "unknown"
+                process_name = self._process_name(conn.pid)
 
                 ports.append(PortInfo(
                     port=conn.laddr.port,
@@ -82,6 +187,12 @@ class SystemMonitor:
         return sorted(ports, key=lambda x: x.port)
 
     def get_process_tree(self) -> Dict[str, Any]:
+        if psutil.LINUX:
+            try:
+                return self._linux_process_tree()
+            except OSError as e:
+                self.logger.warning(f"Falling back to psutil for the process tree: {e}")
+
         process_tree = {}
 
         for proc in psutil.process_iter(['pid', 'ppid', 'name', 'cpu_percent', 'memory_percent']):
@@ -98,19 +209,58 @@ class SystemMonitor:
 
         return process_tree
 
+    def _linux_process_tree(self) -> Dict[int, Dict[str, Any]]:
+        """Process tree from a single read of /proc/<pid>/stat per process"""
+        now = time.monotonic()
+        elapsed = now - self._tree_sampled_at if self._tree_sampled_at is not None else 0.0
+        previous_ticks = self._tree_cpu_ticks
+        cpu_ticks = {}
+        process_tree = {}
+
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/stat', 'rb') as f:
+                        stat = f.read()
+                except OSError:
+                    # Exited since the directory listing
+                    continue
+
+                # The name is parenthesised and may itself contain spaces or parentheses
+                name_end = stat.rindex(b')')
+                fields = stat[name_end + 2:].split()
+                pid = int(entry.name)
+
+                # utime + stime; the start time tells a reused pid apart
+                key = (pid, fields[19])
+                ticks = int(fields[11]) + int(fields[12])
+                cpu_ticks[key] = ticks
+
+                # Like psutil, a process's first sample reports no usage
+                cpu_percent = 0.0
+                if key in previous_ticks and elapsed > 0:
+                    cpu_percent = round((ticks - previous_ticks[key]) / self._clock_ticks / elapsed * 100, 1)
+
+                process_tree[pid] = {
+                    'name': stat[stat.index(b'(') + 1:name_end].decode(errors='replace'),
+                    'ppid': int(fields[1]),
+                    'cpu_percent': cpu_percent,
+                    'memory_percent': int(fields[21]) * self._page_size / self._total_memory * 100
+                }
+
+        self._tree_cpu_ticks = cpu_ticks
+        self._tree_sampled_at = now
+        return process_tree
+
     def get_network_connections(self) -> List[Dict[str, Any]]:
         connections = []
 
         try:
-            for conn in psutil.net_connections(kind='inet'):
+            for conn in self._snapshot_connections():
                 if conn.laddr:
-                    process_name = "unknown"
-                    if conn.pid:
-                        try:
-                            process = psutil.Process(conn.pid)
-                            process_name = process.name()
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
+                    process_name = self._process_name(conn.pid)
 
                     connections.append({
                         'local_address': f"{conn.laddr.ip}:{conn.laddr.port}",
@@ -128,6 +278,22 @@ class SystemMonitor:
     def check_port_availability(self, port: int, protocol: str = "TCP") -> bool:
         sock_type = socket.SOCK_STREAM if protocol.upper() == "TCP" else socket.SOCK_DGRAM
 
+        try:
+            # Read fresh rather than from the shared snapshot, which can miss a port bound
+            # within the last CONNECTIONS_SNAPSHOT_TTL
+            connections = psutil.net_connections(kind='tcp' if sock_type == socket.SOCK_STREAM else 'udp')
+        except psutil.AccessDenied:
+            connections = []
+
+        if connections:
+            # A listening TCP socket, or any bound UDP one, holds the port
+            return not any(
+                conn.laddr and conn.laddr.port == port
+                and (sock_type == socket.SOCK_DGRAM or conn.status == psutil.CONN_LISTEN)
+                for conn in connections
+            )
+
+        # No socket table to consult, so probe by binding
         try:
             with socket.socket(socket.AF_INET, sock_type) as sock:
                 sock.bind(('localhost', port))
@@ -137,8 +303,8 @@ class SystemMonitor:
 
     def get_detailed_cpu_info(self) -> Dict[str, Any]:
         return {
-            'physical_cores': psutil.cpu_count(logical=False),
-            'logical_cores': psutil.cpu_count(logical=True),
+            'physical_cores': self._cpu_count_physical,
+            'logical_cores': self._cpu_count,
             'per_cpu_percent': psutil.cpu_percent(percpu=True),
             'frequency': psutil.cpu_freq()._asdict() if psutil.cpu_freq() else {},
             'stats': psutil.cpu_stats()._asdict()
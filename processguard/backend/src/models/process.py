@@ -1,8 +1,13 @@
+import os
+import shlex
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from array import array
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
+METRICS_HISTORY_MAXLEN = 1000
+
 class ProcessStatus(Enum):
     STOPPED = "stopped"
     STARTING = "starting"
@@ -19,7 +24,7 @@ class ProcessType(Enum):
     RUST = "rust"
     GENERIC = "generic"
 
-@dataclass
+@dataclass(slots=True)
 class ProcessConfig:
     name: str
     command: str
@@ -41,7 +46,17 @@ class ProcessConfig:
     cpu_threshold: float = 80.0
     memory_threshold: float = 80.0
 
-@dataclass
+    _argv_cache: Optional[Tuple[str, List[str]]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def argv(self) -> List[str]:
+        """Command split shell-style into arguments, re-split only when the command changes"""
+        cached = self._argv_cache
+        if cached is None or cached[0] != self.command:
+            cached = self._argv_cache = (self.command, shlex.split(self.command, posix=os.name != 'nt'))
+        return cached[1]
+
+@dataclass(slots=True, frozen=True)
 class ProcessMetrics:
     timestamp: datetime
     pid: Optional[int]
@@ -54,7 +69,41 @@ class ProcessMetrics:
     status: ProcessStatus
     uptime: float
 
-@dataclass
+class MetricsHistory:
+    """Ring buffer of the numeric metric fields, one typed array per field"""
+
+    COLUMNS = {'timestamp': 'd', 'cpu_percent': 'f', 'memory_mb': 'f', 'threads': 'i'}
+
+    def __init__(self, maxlen: int = METRICS_HISTORY_MAXLEN):
+        self.maxlen = maxlen
+        self._columns = {name: array(code, bytes(array(code).itemsize * maxlen))
+                         for name, code in self.COLUMNS.items()}
+        self._head = 0
+        self._size = 0
+        # Only the newest sample is kept whole; connection lists aren't worth retaining
+        self.latest: Optional[ProcessMetrics] = None
+
+    def append(self, metrics: ProcessMetrics):
+        columns = self._columns
+        columns['timestamp'][self._head] = metrics.timestamp.timestamp()
+        columns['cpu_percent'][self._head] = metrics.cpu_percent
+        columns['memory_mb'][self._head] = metrics.memory_mb
+        columns['threads'][self._head] = metrics.threads
+        self._head = (self._head + 1) % self.maxlen
+        self._size = min(self._size + 1, self.maxlen)
+        self.latest = metrics
+
+    def values(self, name: str) -> array:
+        """Samples of one field, oldest first"""
+        column = self._columns[name]
+        if self._size < self.maxlen:
+            return column[:self._size]
+        return column[self._head:] + column[:self._head]
+
+    def __len__(self) -> int:
+        return self._size
+
+@dataclass(slots=True)
 class ManagedProcess:
     config: ProcessConfig
     status: ProcessStatus = ProcessStatus.STOPPED
@@ -62,7 +111,9 @@ class ManagedProcess:
     started_at: Optional[datetime] = None
     restart_count: int = 0
     last_restart: Optional[datetime] = None
-    metrics_history: List[ProcessMetrics] = field(default_factory=list)
+    metrics_history: MetricsHistory = field(default_factory=MetricsHistory)
+    # psutil handle kept across polls so cpu_percent has a previous sample to compare against
+    _ps: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
 
     def get_latest_metrics(self) -> Optional[ProcessMetrics]:
-        return self.metrics_history[-1] if self.metrics_history else None
\ No newline at end of file
+        return self.metrics_history.latest
\ No newline at end of file
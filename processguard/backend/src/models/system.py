@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     timestamp: datetime
     cpu_percent: float
@@ -15,7 +15,7 @@ class SystemMetrics:
     uptime: float
     active_connections: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortInfo:
     port: int
     protocol: str
@@ -23,7 +23,7 @@ class PortInfo:
     pid: int
     status: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemInfo:
     hostname: str
     platform: str
@@ -1,8 +1,17 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
+
+# Writes to stdout and the log file happen on this listener's thread, not the caller's
+_listener: Optional[logging.handlers.QueueListener] = None
 
 def setup_logging(log_level: str = "INFO", log_file: str = None):
+    global _listener
+
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     level = getattr(logging, log_level.upper(), logging.INFO)
@@ -14,11 +23,37 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
         log_path.parent.mkdir(parents=True, exist_ok=True)
         handlers.append(logging.FileHandler(log_file))
 
+    formatter = logging.Formatter(log_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(records)
+    # Only merges args and tracebacks into the message; the real handlers add the prefix
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=level,
-        format=log_format,
-        handlers=handlers
+        handlers=[queue_handler]
     )
 
+    if queue_handler not in logging.getLogger().handlers:
+        # Logging was already configured, which basicConfig leaves alone
+        for handler in handlers:
+            handler.close()
+        return
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(stop_logging)
+
 def get_logger(name: str) -> logging.Logger:
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)